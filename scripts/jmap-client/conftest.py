@@ -1,18 +1,33 @@
 """pytest conftest for JMAP e2e tests with ephemeral test users."""
 
 import os
+import random
 import secrets
 import string
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from uuid import uuid4
 
 import boto3
+from botocore.config import Config
 import jmapc
 import jmapc.session
 import pytest
 import requests
 
+from helpers import (
+    HTTP_SESSION,
+    create_test_mailbox,
+    destroy_all_mailboxes,
+    destroy_emails_and_verify_cleanup,
+    destroy_mailbox,
+    get_email_state,
+    get_mailbox_state,
+    get_thread_state,
+)
+
 # Monkey-patch jmapc.Session to make event_source_url optional
 # RFC 8620 allows omitting eventSourceUrl when SSE is not supported
 from typing import Optional
@@ -21,6 +36,15 @@ jmapc.session.Session.__dataclass_fields__['event_source_url'].type = Optional[s
 jmapc.session.Session.__annotations__['event_source_url'] = Optional[str]
 
 
+# Shared botocore config: pooled keep-alive connections and adaptive retries
+# across the cleanup verification loop.
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=16,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
 @dataclass
 class TestAccount:
     """Ephemeral test account credentials."""
@@ -95,6 +119,40 @@ def delete_test_user(cognito_client, user_pool_id: str, username: str) -> None:
     )
 
 
+# Server-side filter matching everything except infrastructure records
+NON_INFRASTRUCTURE_FILTER = (
+    "NOT (begins_with(sk, :meta) OR begins_with(sk, :state) OR begins_with(sk, :change))"
+)
+NON_INFRASTRUCTURE_VALUES = {
+    ":meta": {"S": "META#"},
+    ":state": {"S": "STATE#"},
+    ":change": {"S": "CHANGE#"},
+}
+
+
+def iter_account_items(dynamodb_client, table_name: str, account_id: str,
+                       projection: str, filter_expression: str | None = None,
+                       filter_values: dict | None = None) -> Iterator[dict]:
+    """Yield every item in an account's partition, following LastEvaluatedKey."""
+    query_args = {
+        "TableName": table_name,
+        "KeyConditionExpression": "pk = :pk",
+        "ExpressionAttributeValues": {
+            ":pk": {"S": f"ACCOUNT#{account_id}"},
+            **(filter_values or {}),
+        },
+        "ProjectionExpression": projection,
+        "PaginationConfig": {"PageSize": 1000},
+    }
+    if filter_expression:
+        query_args["FilterExpression"] = filter_expression
+
+    paginator = dynamodb_client.get_paginator("query")
+    pages = paginator.paginate(**query_args)
+    for page in pages:
+        yield from page.get("Items", [])
+
+
 def verify_dynamodb_clean(dynamodb_client, table_name: str, account_id: str) -> list[dict]:
     """Verify only infrastructure records exist. Returns list of orphan items if any.
 
@@ -103,22 +161,18 @@ def verify_dynamodb_clean(dynamodb_client, table_name: str, account_id: str) ->
     - STATE#* - permanent state counters per object type
     - CHANGE#* - change log entries with 7-day TTL for /changes API
     """
-    response = dynamodb_client.query(
-        TableName=table_name,
-        KeyConditionExpression="pk = :pk",
-        ExpressionAttributeValues={":pk": {"S": f"ACCOUNT#{account_id}"}},
-    )
-
     orphans = []
-    for item in response.get("Items", []):
-        sk = item["sk"]["S"]
-        # Allow infrastructure records: META#, STATE#*, CHANGE#*
-        if sk.startswith(("META#", "STATE#", "CHANGE#")):
-            continue
-
+    # Infrastructure records (META#, STATE#*, CHANGE#*) are filtered out by
+    # DynamoDB, so every returned item is an orphan
+    items = iter_account_items(
+        dynamodb_client, table_name, account_id, "sk, deletedAt",
+        filter_expression=NON_INFRASTRUCTURE_FILTER,
+        filter_values=NON_INFRASTRUCTURE_VALUES,
+    )
+    for item in items:
         # Return the full item with key fields extracted
         orphan_info = {
-            "sk": sk,
+            "sk": item["sk"]["S"],
             "has_deletedAt": "deletedAt" in item,
         }
         if "deletedAt" in item:
@@ -129,39 +183,99 @@ def verify_dynamodb_clean(dynamodb_client, table_name: str, account_id: str) ->
 
 
 def verify_s3_clean(s3_client, bucket: str, account_id: str) -> list[str]:
-    """Verify no S3 objects exist for account. Returns list of orphan keys if any."""
+    """Verify no S3 objects exist for account. Returns list of orphan keys if any.
+
+    Stops at the first page containing objects; one page of keys is enough
+    to report the failure.
+    """
     if not bucket:
         return []
 
-    response = s3_client.list_objects_v2(
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
         Bucket=bucket,
         Prefix=f"{account_id}/",
+        PaginationConfig={"PageSize": 1000},
     )
+    for page in pages:
+        contents = page.get("Contents", [])
+        if contents:
+            return [obj["Key"] for obj in contents]
+
+    return []
+
 
-    return [obj["Key"] for obj in response.get("Contents", [])]
+def describe_dynamodb_orphans(dynamodb_client, table_name: str, account_id: str) -> str | None:
+    """Return an error message listing orphaned records in table_name, or None if clean."""
+    orphans = verify_dynamodb_clean(dynamodb_client, table_name, account_id)
+    if not orphans:
+        return None
+    orphan_details = "\n".join([
+        f"  {o['sk']}: deletedAt={o.get('deletedAt', 'NOT SET')}"
+        for o in orphans
+    ])
+    return f"Orphaned records in {table_name}:\n{orphan_details}"
+
+
+def describe_s3_orphans(s3_client, bucket: str, account_id: str) -> str | None:
+    """Return an error message listing orphaned S3 objects in bucket, or None if clean."""
+    orphans = verify_s3_clean(s3_client, bucket, account_id)
+    if not orphans:
+        return None
+    return f"Orphaned S3 objects in {bucket}: {orphans}"
 
 
 def delete_infrastructure_records(dynamodb_client, table_name: str, account_id: str) -> None:
     """Delete infrastructure records (META#, STATE#*, CHANGE#*) for cleanup."""
-    # Query all records for this account
-    response = dynamodb_client.query(
-        TableName=table_name,
-        KeyConditionExpression="pk = :pk",
-        ExpressionAttributeValues={":pk": {"S": f"ACCOUNT#{account_id}"}},
-        ProjectionExpression="sk",
-    )
+    # Stream infrastructure records into BatchWriteItem calls of at most 25
+    pk = {"S": f"ACCOUNT#{account_id}"}
+    batch = []
+    for item in iter_account_items(dynamodb_client, table_name, account_id, "sk"):
+        if item["sk"]["S"].startswith(("META#", "STATE#", "CHANGE#")):
+            batch.append({"DeleteRequest": {"Key": {"pk": pk, "sk": item["sk"]}}})
+            if len(batch) == 25:
+                batch_write_with_retry(dynamodb_client, table_name, batch)
+                batch = []
+    if batch:
+        batch_write_with_retry(dynamodb_client, table_name, batch)
+
+
+def batch_write_with_retry(dynamodb_client, table_name: str, write_requests: list[dict],
+                           max_attempts: int = 5) -> None:
+    """Send a BatchWriteItem, retrying UnprocessedItems with exponential backoff."""
+    request_items = {table_name: write_requests}
+    delay = 0.1
+    for attempt in range(max_attempts):
+        response = dynamodb_client.batch_write_item(RequestItems=request_items)
+        request_items = response.get("UnprocessedItems", {})
+        if not request_items:
+            return
+        if attempt < max_attempts - 1:
+            time.sleep(delay)
+            delay *= 2
+
+    remaining = len(request_items.get(table_name, []))
+    raise RuntimeError(f"{remaining} items in {table_name} still unprocessed after {max_attempts} attempts")
 
-    # Delete infrastructure records
-    for item in response.get("Items", []):
-        sk = item["sk"]["S"]
-        if sk.startswith(("META#", "STATE#", "CHANGE#")):
-            dynamodb_client.delete_item(
-                TableName=table_name,
-                Key={
-                    "pk": {"S": f"ACCOUNT#{account_id}"},
-                    "sk": {"S": sk},
-                },
-            )
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Shared requests.Session with pooled keep-alive connections."""
+    return HTTP_SESSION
+
+
+@pytest.fixture(scope="session")
+def jmap_api_session(token):
+    """requests.Session for direct JMAP API calls with the bearer token preset.
+
+    Kept separate from HTTP_SESSION, which also talks to presigned S3 URLs that
+    must not receive an Authorization header, but mounts the same adapter so
+    both share one connection pool.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTP_SESSION.get_adapter("https://"))
+    session.headers["Authorization"] = f"Bearer {token}"
+    return session
 
 
 @pytest.fixture(scope="session")
@@ -213,25 +327,48 @@ def cognito_client_id():
 
 
 @pytest.fixture(scope="session")
-def test_account(jmap_host, cognito_user_pool_id, cognito_client_id,
-                 dynamodb_table, dynamodb_email_table, blob_bucket, aws_region):
-    """Create ephemeral test user, yield credentials, verify and cleanup."""
-    cognito = boto3.client("cognito-idp", region_name=aws_region)
-    dynamodb = boto3.client("dynamodb", region_name=aws_region)
-    s3 = boto3.client("s3", region_name=aws_region)
+def cognito_client(aws_region):
+    """Cognito Identity Provider client shared across the session."""
+    return boto3.client("cognito-idp", region_name=aws_region, config=AWS_CLIENT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def dynamodb_client(aws_region):
+    """DynamoDB client shared across the session."""
+    return boto3.client("dynamodb", region_name=aws_region, config=AWS_CLIENT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def s3_client(aws_region):
+    """S3 client shared across the session."""
+    return boto3.client("s3", region_name=aws_region, config=AWS_CLIENT_CONFIG)
+
 
+@pytest.fixture(scope="session")
+def test_account(jmap_host, cognito_user_pool_id, cognito_client_id,
+                 dynamodb_table, dynamodb_email_table, blob_bucket,
+                 cognito_client, dynamodb_client, s3_client):
+    """Create ephemeral test user, yield credentials, verify and cleanup.
+
+    Runs once per pytest process (one per worker under pytest-xdist). Every
+    fixture derived from it (token, account_id, jmap_client, api_url,
+    upload_url) must stay session-scoped so the Cognito user, mailbox wait
+    and cleanup verification are paid for only once. Workers deliberately
+    get separate accounts: teardown asserts the account is empty, which
+    cannot hold while another worker is still using it.
+    """
     # Create user
-    username, password = create_test_user(cognito, cognito_user_pool_id)
+    username, password = create_test_user(cognito_client, cognito_user_pool_id)
     print(f"\nCreated test user: {username}")
 
     try:
         # Authenticate
-        token = authenticate_user(cognito, cognito_user_pool_id, cognito_client_id,
+        token = authenticate_user(cognito_client, cognito_user_pool_id, cognito_client_id,
                                   username, password)
 
         # Trigger META# creation via discovery request
         session_url = f"https://{jmap_host}/.well-known/jmap"
-        resp = requests.get(session_url, headers={
+        resp = HTTP_SESSION.get(session_url, headers={
             "Authorization": f"Bearer {token}",
             "X-JMAP-Stage": "e2e",
         }, timeout=30)
@@ -249,12 +386,15 @@ def test_account(jmap_host, cognito_user_pool_id, cognito_client_id,
         # Wait for special mailboxes to be created (async via SQS)
         from helpers import get_all_mailboxes, verify_special_mailboxes
 
+        # Poll with exponential backoff so we notice the mailboxes soon after
+        # they land rather than up to a full fixed interval later.
         max_wait = 30
-        interval = 2
-        start = time.time()
+        interval = 0.1
+        max_interval = 2.0
+        deadline = time.monotonic() + max_wait
         mailboxes = []
 
-        while time.time() - start < max_wait:
+        while time.monotonic() < deadline:
             mailboxes = get_all_mailboxes(api_url, token, account_id)
             if len(mailboxes) >= 6:
                 try:
@@ -264,6 +404,7 @@ def test_account(jmap_host, cognito_user_pool_id, cognito_client_id,
                 except AssertionError:
                     pass
             time.sleep(interval)
+            interval = min(interval * 1.5, max_interval)
         else:
             pytest.fail(f"Special mailboxes not created within {max_wait}s. Found: {[m.get('role') for m in mailboxes]}")
 
@@ -273,65 +414,61 @@ def test_account(jmap_host, cognito_user_pool_id, cognito_client_id,
         yield TestAccount(username=username, password=password, token=token, account_id=account_id)
 
         # Cleanup mailboxes created by jmap-service-email
-        from helpers import destroy_all_mailboxes
         if mailbox_ids:
             destroy_all_mailboxes(api_url, token, account_id, mailbox_ids)
             print(f"Destroyed {len(mailbox_ids)} mailboxes")
 
         # Verify cleanliness - this is a test assertion, not cleanup
         # Retry with backoff to allow async cleanup (DynamoDB Streams) to complete
-        max_attempts = 6
-        wait_seconds = 5
+        verify_budget = 30
+        wait = 0.5
+        max_wait = 8.0
         errors = []
 
-        for attempt in range(max_attempts):
-            errors = []
-
-            # Check core table
-            if dynamodb_table:
-                orphans = verify_dynamodb_clean(dynamodb, dynamodb_table, account_id)
-                if orphans:
-                    orphan_details = "\n".join([
-                        f"  {o['sk']}: deletedAt={o.get('deletedAt', 'NOT SET')}"
-                        for o in orphans
-                    ])
-                    errors.append(f"Orphaned records in {dynamodb_table}:\n{orphan_details}")
-
-            # Check email table
-            if dynamodb_email_table:
-                orphans = verify_dynamodb_clean(dynamodb, dynamodb_email_table, account_id)
-                if orphans:
-                    orphan_details = "\n".join([
-                        f"  {o['sk']}: deletedAt={o.get('deletedAt', 'NOT SET')}"
-                        for o in orphans
-                    ])
-                    errors.append(f"Orphaned records in {dynamodb_email_table}:\n{orphan_details}")
-
-            # Check S3
-            if blob_bucket:
-                orphans = verify_s3_clean(s3, blob_bucket, account_id)
-                if orphans:
-                    errors.append(f"Orphaned S3 objects in {blob_bucket}: {orphans}")
-
-            if not errors:
-                break
-
-            if attempt < max_attempts - 1:
-                print(f"Waiting {wait_seconds}s for async cleanup (attempt {attempt + 1}/{max_attempts})...")
-                time.sleep(wait_seconds)
+        checks = []
+        if dynamodb_table:
+            checks.append((describe_dynamodb_orphans, dynamodb_client, dynamodb_table))
+        if dynamodb_email_table:
+            checks.append((describe_dynamodb_orphans, dynamodb_client, dynamodb_email_table))
+        if blob_bucket:
+            checks.append((describe_s3_orphans, s3_client, blob_bucket))
+
+        # The checks are independent round trips, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            deadline = time.monotonic() + verify_budget
+            attempt = 0
+            while True:
+                attempt += 1
+                futures = [
+                    executor.submit(check, client, name, account_id)
+                    for check, client, name in checks
+                ]
+                errors = [error for error in (f.result() for f in futures) if error]
+
+                if not errors:
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                delay = min(wait + random.uniform(0, wait * 0.1), remaining)
+                print(f"Waiting {delay:.1f}s for async cleanup (attempt {attempt})...")
+                time.sleep(delay)
+                wait = min(wait * 2, max_wait)
 
         if errors:
             pytest.fail("Test cleanup verification failed:\n" + "\n".join(errors))
 
         # Cleanup infrastructure (only after verification passes)
         if dynamodb_table:
-            delete_infrastructure_records(dynamodb, dynamodb_table, account_id)
+            delete_infrastructure_records(dynamodb_client, dynamodb_table, account_id)
         if dynamodb_email_table:
-            delete_infrastructure_records(dynamodb, dynamodb_email_table, account_id)
+            delete_infrastructure_records(dynamodb_client, dynamodb_email_table, account_id)
 
     finally:
         # Always delete the Cognito user
-        delete_test_user(cognito, cognito_user_pool_id, username)
+        delete_test_user(cognito_client, cognito_user_pool_id, username)
         print(f"Deleted test user: {username}")
 
 
@@ -377,6 +514,40 @@ def upload_url(jmap_client):
     return jmap_client.jmap_session.upload_url
 
 
+@pytest.fixture(scope="session")
+def download_url(jmap_client):
+    """Get the JMAP download URL template from the session."""
+    return jmap_client.jmap_session.download_url
+
+
+@pytest.fixture(scope="session")
+def blob_url_templates(download_url, account_id):
+    """Download/delete URL templates with {accountId} already filled in.
+
+    Callers only need to substitute {blobId}.
+    """
+    return {
+        "download": download_url.replace("{accountId}", account_id),
+        "delete": download_url.replace("/download/", "/delete/").replace("{accountId}", account_id),
+    }
+
+
+@pytest.fixture(scope="session")
+def jmap_session_doc(jmap_host, token):
+    """Raw JMAP session document, fetched once per session.
+
+    jmapc doesn't expose raw accounts/accountCapabilities, so tests that need
+    them read this instead of fetching .well-known/jmap themselves.
+    """
+    response = HTTP_SESSION.get(
+        f"https://{jmap_host}/.well-known/jmap",
+        headers={"Authorization": f"Bearer {token}", **E2E_STAGE_HEADER},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 @pytest.fixture(scope="session")
 def api_gateway_invoke_url():
     """API Gateway invoke URL for IAM-authenticated requests.
@@ -395,3 +566,61 @@ def e2e_test_role_arn():
     IAM-authenticated tests skip when empty.
     """
     return os.environ.get("E2E_TEST_ROLE_ARN", "")
+
+
+@pytest.fixture(scope="class")
+def initial_email_state(api_url, token, account_id):
+    """Email state fetched once per class, for read-only state tests."""
+    state = get_email_state(api_url, token, account_id)
+    assert state is not None, "Failed to get initial Email state"
+    return state
+
+
+@pytest.fixture(scope="class")
+def initial_mailbox_state(api_url, token, account_id):
+    """Mailbox state fetched once per class, for read-only state tests."""
+    state = get_mailbox_state(api_url, token, account_id)
+    assert state is not None, "Failed to get initial Mailbox state"
+    return state
+
+
+@pytest.fixture(scope="class")
+def initial_thread_state(api_url, token, account_id):
+    """Thread state fetched once per class, for read-only state tests."""
+    state = get_thread_state(api_url, token, account_id)
+    assert state is not None, "Failed to get initial Thread state"
+    return state
+
+
+@pytest.fixture(scope="session")
+def changes_mailbox(api_url, token, account_id):
+    """Mailbox shared by the state-change tests for the whole session."""
+    mailbox_id = create_test_mailbox(api_url, token, account_id, prefix="ChangesTest")
+    assert mailbox_id is not None, "Failed to create test mailbox"
+    yield mailbox_id
+    destroy_mailbox(api_url, token, account_id, mailbox_id, on_destroy_remove_emails=True)
+
+
+@pytest.fixture(scope="session")
+def scratch_mailbox_pool(api_url, token, account_id):
+    """Yield a list that tests append scratch mailbox IDs to.
+
+    Scratch mailboxes are never destroyed individually; they are all removed
+    with a single Mailbox/set at the end of the session.
+    """
+    mailbox_ids = []
+    yield mailbox_ids
+    destroy_all_mailboxes(api_url, token, account_id, mailbox_ids)
+
+
+@pytest.fixture
+def mailbox_and_cleanup(changes_mailbox, api_url, token, account_id):
+    """Yield the shared changes mailbox and a fresh list of email IDs to clean up.
+
+    Emails recorded by the test are destroyed (and verified gone) when it ends;
+    the mailbox itself persists until the end of the session.
+    """
+    email_ids = []
+    yield changes_mailbox, email_ids
+    if email_ids:
+        destroy_emails_and_verify_cleanup(api_url, token, account_id, email_ids)
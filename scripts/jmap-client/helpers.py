@@ -1,15 +1,35 @@
 """Shared helpers for JMAP e2e tests."""
 
-import json
+import string
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import NamedTuple
 
 import boto3
 import botocore.auth
 import botocore.awsrequest
 import botocore.credentials
 import botocore.session
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared HTTP session so every JMAP call reuses pooled keep-alive connections
+# instead of paying a fresh TCP + TLS handshake per request. Helpers also use
+# it from worker threads (batched uploads, blob deletes); pool_maxsize is
+# sized above those fan-outs so concurrent requests never queue for a socket.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
 
 
 def make_iam_jmap_request(
@@ -33,7 +53,7 @@ def make_iam_jmap_request(
         using = ["urn:ietf:params:jmap:core"]
 
     url = f"{api_gateway_invoke_url}/jmap-iam/{account_id}"
-    body = json.dumps({
+    body = orjson.dumps({
         "using": using,
         "methodCalls": method_calls,
     })
@@ -60,17 +80,17 @@ def make_iam_jmap_request(
         method="POST",
         url=url,
         data=body,
-        headers={"Content-Type": "application/json"},
+        headers={"Content-Type": JSON_CONTENT_TYPE},
     )
     botocore.auth.SigV4Auth(credentials, "execute-api", region).add_auth(request)
 
-    response = requests.post(
+    response = HTTP_SESSION.post(
         url,
         headers=dict(request.headers),
         data=body,
         timeout=30,
     )
-    return response.json()
+    return orjson.loads(response.content)
 
 
 # Expected special mailboxes created by jmap-service-email on account init
@@ -83,60 +103,147 @@ EXPECTED_SPECIAL_MAILBOXES = {
     "archive": {"name": "Archive", "sortOrder": 5},
 }
 
+# RFC 5322 bodies for generated test emails, CRLF-terminated up front so
+# no newline rewriting pass is needed per message.
+TEST_EMAIL_TEMPLATE = string.Template(
+    "From: Test Sender <test@example.com>\r\n"
+    "To: Test Recipient <recipient@example.com>\r\n"
+    "Subject: Test Email $short_id\r\n"
+    "Date: $date\r\n"
+    "Message-ID: $message_id\r\n"
+    "Content-Type: text/plain; charset=utf-8\r\n"
+    "\r\n"
+    "This is a test email.\r\n"
+)
+
+HEADERS_EMAIL_TEMPLATE = string.Template(
+    "From: Test Sender <test@example.com>\r\n"
+    "To: Test Recipient <recipient@example.com>\r\n"
+    "Subject: $subject\r\n"
+    "Date: $date\r\n"
+    "Message-ID: $message_id\r\n"
+    "${in_reply_to_header}"
+    "Content-Type: text/plain; charset=utf-8\r\n"
+    "\r\n"
+    "Test email: $subject\r\n"
+)
+
+
+# Capabilities sent with every make_jmap_request call
+JMAP_USING = ["urn:ietf:params:jmap:core", "urn:ietf:params:jmap:mail"]
+
+JSON_CONTENT_TYPE = "application/json"
+RFC822_CONTENT_TYPE = "message/rfc822"
+
 
 def make_jmap_request(api_url: str, token: str, method_calls: list) -> dict:
     """Make a raw JMAP API request."""
-    request_body = {
-        "using": ["urn:ietf:params:jmap:core", "urn:ietf:params:jmap:mail"],
+    body = orjson.dumps({
+        "using": JMAP_USING,
         "methodCalls": method_calls,
-    }
-    response = requests.post(
+    })
+    response = HTTP_SESSION.post(
         api_url,
         headers={
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
+            "Content-Type": JSON_CONTENT_TYPE,
         },
-        json=request_body,
+        data=body,
         timeout=30,
     )
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def create_test_mailbox(
-    api_url: str, token: str, account_id: str, prefix: str = "Test"
-) -> str | None:
-    """Create a test mailbox. Returns mailbox ID or None on failure."""
-    unique_id = str(uuid.uuid4())[:8]
-    mailbox_name = f"{prefix}-{unique_id}"
+class MethodResponse(NamedTuple):
+    """One JMAP method response: [name, arguments, method call id]."""
 
-    mailbox_set_call = [
+    name: str
+    data: dict
+    tag: str
+
+
+def make_jmap_batch(api_url: str, token: str, method_calls: list) -> list[MethodResponse]:
+    """Send several method calls in one JMAP request.
+
+    Returns the methodResponses as MethodResponse tuples (empty if the
+    response has none).
+    """
+    response = make_jmap_request(api_url, token, method_calls)
+    return [MethodResponse(*mr) for mr in response.get("methodResponses", [])]
+
+
+def unpack_single_response(response: dict, expected_method: str) -> dict:
+    """Return the data of the first method response in a JMAP response.
+
+    Raises AssertionError if there are no method responses, the first one is
+    a JMAP "error", or its name is not expected_method.
+    """
+    method_responses = response.get("methodResponses")
+    if not method_responses:
+        raise AssertionError(f"No methodResponses: {response}")
+
+    first = MethodResponse(*method_responses[0])
+    if first.name == "error":
+        raise AssertionError(
+            f"JMAP error: {first.data.get('type')}: {first.data.get('description')}"
+        )
+    if first.name != expected_method:
+        raise AssertionError(f"Unexpected method: {first.name}")
+
+    return first.data
+
+
+def _single_response(
+    api_url: str, token: str, call: list
+) -> tuple[str, dict] | None:
+    """Send a single method call and return its (name, data) response.
+
+    Returns None if the request fails, there is no method response, or the
+    response name does not match the call (e.g. a JMAP "error").
+    """
+    try:
+        response = make_jmap_request(api_url, token, [call])
+    except Exception:
+        return None
+
+    method_responses = response.get("methodResponses")
+    if not method_responses:
+        return None
+
+    response_name, response_data, _ = method_responses[0]
+    if response_name != call[0]:
+        return None
+
+    return response_name, response_data
+
+
+def make_mailbox_create_call(account_id: str, prefix: str = "Test") -> list:
+    """Build a Mailbox/set call creating one uniquely named mailbox as "testMailbox"."""
+    unique_id = uuid.uuid4().hex[:8]
+    return [
         "Mailbox/set",
         {
             "accountId": account_id,
             "create": {
                 "testMailbox": {
-                    "name": mailbox_name,
+                    "name": f"{prefix}-{unique_id}",
                 }
             },
         },
         "createMailbox0",
     ]
 
-    try:
-        response = make_jmap_request(api_url, token, [mailbox_set_call])
-    except Exception:
-        return None
 
-    if "methodResponses" not in response:
-        return None
-
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
+def create_test_mailbox(
+    api_url: str, token: str, account_id: str, prefix: str = "Test"
+) -> str | None:
+    """Create a test mailbox. Returns mailbox ID or None on failure."""
+    mailbox_set_call = make_mailbox_create_call(account_id, prefix)
 
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Mailbox/set":
+    result = _single_response(api_url, token, mailbox_set_call)
+    if result is None:
         return None
+    _, response_data = result
 
     created = response_data.get("created", {})
     mailbox_info = created.get("testMailbox")
@@ -150,60 +257,75 @@ def upload_email_blob(
     upload_url: str,
     token: str,
     account_id: str,
-    email_content: str,
+    email_content: str | bytes,
 ) -> str | None:
     """Upload an email as a blob. Returns blobId or None on failure."""
+    if isinstance(email_content, str):
+        email_content = email_content.encode("utf-8")
     upload_endpoint = upload_url.replace("{accountId}", account_id)
     headers = {
         "Authorization": f"Bearer {token}",
-        "Content-Type": "message/rfc822",
+        "Content-Type": RFC822_CONTENT_TYPE,
     }
 
     try:
-        upload_response = requests.post(
+        upload_response = HTTP_SESSION.post(
             upload_endpoint,
             headers=headers,
-            data=email_content.encode("utf-8"),
+            data=email_content,
             timeout=30,
         )
         if upload_response.status_code != 201:
             return None
-        upload_data = upload_response.json()
+        upload_data = orjson.loads(upload_response.content)
         return upload_data.get("blobId")
     except Exception:
         return None
 
 
-def import_test_email(
-    api_url: str,
+def _email_dates(received_at: datetime) -> tuple[str, str]:
+    """Format received_at as (JMAP receivedAt, RFC 5322 Date header)."""
+    return (
+        received_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        received_at.strftime("%a, %d %b %Y %H:%M:%S %z"),
+    )
+
+
+def upload_test_email(
     upload_url: str,
     token: str,
     account_id: str,
-    mailbox_id: str,
-    keywords: dict | None = None,
-) -> str | None:
-    """Import a test email. Returns email ID or None on failure."""
-    unique_id = str(uuid.uuid4())
-    message_id = f"<test-{unique_id}@jmap-test.example>"
+    received_at: datetime | None = None,
+) -> tuple[str | None, str]:
+    """Upload a unique test email. Returns (blobId or None, receivedAt string).
 
-    received_at = datetime.now(timezone.utc)
-    received_at_str = received_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-    date_str = received_at.strftime("%a, %d %b %Y %H:%M:%S %z")
+    received_at defaults to now; batches pass one shared value.
+    """
+    unique_id = uuid.uuid4().hex
+    message_id = f"<test-{unique_id}@jmap-test.example>"
 
-    email_content = f"""From: Test Sender <test@example.com>
-To: Test Recipient <recipient@example.com>
-Subject: Test Email {unique_id[:8]}
-Date: {date_str}
-Message-ID: {message_id}
-Content-Type: text/plain; charset=utf-8
+    if received_at is None:
+        received_at = datetime.now(timezone.utc)
+    received_at_str, date_str = _email_dates(received_at)
 
-This is a test email.
-""".replace("\n", "\r\n")
+    email_content = TEST_EMAIL_TEMPLATE.substitute(
+        short_id=unique_id[:8],
+        date=date_str,
+        message_id=message_id,
+    ).encode("utf-8")
 
     blob_id = upload_email_blob(upload_url, token, account_id, email_content)
-    if not blob_id:
-        return None
+    return blob_id, received_at_str
 
+
+def make_import_call(
+    account_id: str,
+    mailbox_id: str,
+    blob_id: str,
+    received_at_str: str,
+    keywords: dict | None = None,
+) -> list:
+    """Build an Email/import call for one uploaded blob under creation id "email"."""
     email_data = {
         "blobId": blob_id,
         "mailboxIds": {mailbox_id: True},
@@ -212,7 +334,7 @@ This is a test email.
     if keywords:
         email_data["keywords"] = keywords
 
-    import_call = [
+    return [
         "Email/import",
         {
             "accountId": account_id,
@@ -223,27 +345,224 @@ This is a test email.
         "import0",
     ]
 
-    try:
-        import_response = make_jmap_request(api_url, token, [import_call])
-    except Exception:
-        return None
 
-    if "methodResponses" not in import_response:
+def import_test_email(
+    api_url: str,
+    upload_url: str,
+    token: str,
+    account_id: str,
+    mailbox_id: str,
+    keywords: dict | None = None,
+) -> str | None:
+    """Import a test email. Returns email ID or None on failure."""
+    email_id, _ = import_test_email_returning_thread(
+        api_url, upload_url, token, account_id, mailbox_id, keywords
+    )
+    return email_id
+
+
+def import_test_email_returning_thread(
+    api_url: str,
+    upload_url: str,
+    token: str,
+    account_id: str,
+    mailbox_id: str,
+    keywords: dict | None = None,
+) -> tuple[str | None, str | None]:
+    """Import a test email. Returns (email_id, thread_id) or (None, None) on failure."""
+    blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+    if not blob_id:
+        return None, None
+
+    import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str, keywords)
+
+    result = _single_response(api_url, token, import_call)
+    if result is None:
+        return None, None
+    _, response_data = result
+
+    email_info = response_data.get("created", {}).get("email")
+    if not email_info:
+        return None, None
+
+    return email_info.get("id"), email_info.get("threadId")
+
+
+def _import_uploaded_batch(
+    api_url: str,
+    upload_url: str,
+    token: str,
+    account_id: str,
+    mailbox_id: str,
+    count: int,
+    state_type: str | None = None,
+) -> tuple[str | None, list[tuple[str, str]]] | None:
+    """Upload `count` test emails concurrently and import them in one request.
+
+    All emails go into a single Email/import call, with creation ids
+    email0..emailN. If state_type is given, the request starts with
+    {state_type}/get and the import back-references its accountId, so the
+    state is read before the import runs (the dispatcher otherwise runs
+    independent calls in parallel).
+
+    Returns (state or None, [(email_id, thread_id), ...]) or None if any
+    upload or import failed.
+    """
+    received_at = datetime.now(timezone.utc)
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        uploads = list(executor.map(
+            lambda _: upload_test_email(upload_url, token, account_id, received_at), range(count)
+        ))
+    if not all(blob_id for blob_id, _ in uploads):
         return None
 
-    method_responses = import_response["methodResponses"]
-    if len(method_responses) == 0:
+    emails = {}
+    for i, (blob_id, received_at_str) in enumerate(uploads):
+        _, args, _ = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        emails[f"email{i}"] = args["emails"]["email"]
+    import_call = ["Email/import", {"accountId": account_id, "emails": emails}, "import0"]
+
+    method_calls = []
+    if state_type:
+        state_call = [f"{state_type}/get", {"accountId": account_id, "ids": []}, "state0"]
+        method_calls.append(state_call)
+        import_call = _ordered_after(import_call, state_call)
+    method_calls.append(import_call)
+
+    try:
+        method_responses = make_jmap_batch(api_url, token, method_calls)
+    except Exception:
         return None
 
-    response_name, response_data, _ = method_responses[0]
+    by_call_id = {call_id: (name, data) for name, data, call_id in method_responses}
+    response_name, response_data = by_call_id.get("import0", (None, {}))
     if response_name != "Email/import":
         return None
 
     created = response_data.get("created", {})
-    if "email" not in created:
+    imported = []
+    for i in range(count):
+        email_info = created.get(f"email{i}")
+        if not email_info:
+            return None
+        imported.append((email_info.get("id"), email_info.get("threadId")))
+
+    state = None
+    if state_type:
+        response_name, response_data = by_call_id.get("state0", (None, {}))
+        if response_name == f"{state_type}/get":
+            state = response_data.get("state")
+
+    return state, imported
+
+
+def setup_changes_test(
+    api_url: str,
+    upload_url: str,
+    token: str,
+    account_id: str,
+    mailbox_id: str,
+    n_emails: int,
+    type_name: str = "Email",
+) -> tuple[str, list[tuple[str, str]]] | None:
+    """
+    Read the initial {type_name} state and import test emails in one request.
+
+    Returns (initial_state, [(email_id, thread_id), ...]) or None on failure.
+    """
+    result = _import_uploaded_batch(
+        api_url, upload_url, token, account_id, mailbox_id, n_emails, state_type=type_name
+    )
+    if result is None or result[0] is None:
         return None
+    return result
+
+
+def import_and_fetch(
+    api_url: str,
+    upload_url: str,
+    token: str,
+    account_id: str,
+    mailbox_id: str,
+    properties: list[str],
+    keywords: dict | None = None,
+) -> tuple[str | None, str | None, dict | None]:
+    """
+    Import a test email and Email/get it back in the same JMAP request.
+
+    The Email/get references the imported id via a result reference, so the
+    import and the read-back cost one round trip instead of two.
+
+    Returns (email_id, thread_id, fetched_email) or (None, None, None) on failure.
+    """
+    blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+    if not blob_id:
+        return None, None, None
+
+    method_calls = [
+        make_import_call(account_id, mailbox_id, blob_id, received_at_str, keywords),
+        [
+            "Email/get",
+            {
+                "accountId": account_id,
+                "#ids": {
+                    "resultOf": "import0",
+                    "name": "Email/import",
+                    "path": "/created/email/id",
+                },
+                "properties": properties,
+            },
+            "get0",
+        ],
+    ]
+
+    try:
+        method_responses = make_jmap_batch(api_url, token, method_calls)
+    except Exception:
+        return None, None, None
+
+    by_call_id = {call_id: (name, data) for name, data, call_id in method_responses}
+
+    import_name, import_data = by_call_id.get("import0", (None, {}))
+    if import_name != "Email/import":
+        return None, None, None
+
+    email_info = import_data.get("created", {}).get("email")
+    if not email_info:
+        return None, None, None
+
+    fetched = None
+    get_name, get_data = by_call_id.get("get0", (None, {}))
+    if get_name == "Email/get" and get_data.get("list"):
+        fetched = get_data["list"][0]
+
+    return email_info.get("id"), email_info.get("threadId"), fetched
+
+
+def upload_email_with_headers(
+    upload_url: str,
+    token: str,
+    account_id: str,
+    message_id: str,
+    in_reply_to: str | None,
+    subject: str,
+    received_at: datetime,
+) -> tuple[str | None, str]:
+    """Upload an email with specific Message-ID and In-Reply-To headers.
 
-    return created["email"].get("id")
+    Returns (blobId or None, receivedAt string).
+    """
+    received_at_str, date_str = _email_dates(received_at)
+
+    email_content = HEADERS_EMAIL_TEMPLATE.substitute(
+        subject=subject,
+        date=date_str,
+        message_id=message_id,
+        in_reply_to_header=f"In-Reply-To: {in_reply_to}\r\n" if in_reply_to else "",
+    ).encode("utf-8")
+
+    blob_id = upload_email_blob(upload_url, token, account_id, email_content)
+    return blob_id, received_at_str
 
 
 def import_email_with_headers(
@@ -262,131 +581,156 @@ def import_email_with_headers(
 
     Returns (email_id, thread_id) or (None, None) on failure.
     """
-    received_at_str = received_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-    date_str = received_at.strftime("%a, %d %b %Y %H:%M:%S %z")
-
-    headers_block = f"""From: Test Sender <test@example.com>
-To: Test Recipient <recipient@example.com>
-Subject: {subject}
-Date: {date_str}
-Message-ID: {message_id}"""
-
-    if in_reply_to:
-        headers_block += f"\nIn-Reply-To: {in_reply_to}"
-
-    email_content = f"""{headers_block}
-Content-Type: text/plain; charset=utf-8
-
-Test email: {subject}
-""".replace("\n", "\r\n")
-
-    blob_id = upload_email_blob(upload_url, token, account_id, email_content)
+    blob_id, received_at_str = upload_email_with_headers(
+        upload_url, token, account_id, message_id, in_reply_to, subject, received_at
+    )
     if not blob_id:
         return None, None
 
-    import_call = [
-        "Email/import",
-        {
-            "accountId": account_id,
-            "emails": {
-                "email": {
-                    "blobId": blob_id,
-                    "mailboxIds": {mailbox_id: True},
-                    "receivedAt": received_at_str,
-                }
-            },
-        },
-        "import0",
-    ]
+    import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
 
-    try:
-        import_response = make_jmap_request(api_url, token, [import_call])
-    except Exception:
+    result = _single_response(api_url, token, import_call)
+    if result is None:
         return None, None
+    _, response_data = result
 
-    if "methodResponses" not in import_response:
+    email_info = response_data.get("created", {}).get("email")
+    if not email_info:
         return None, None
 
-    method_responses = import_response["methodResponses"]
-    if len(method_responses) == 0:
-        return None, None
+    return email_info.get("id"), email_info.get("threadId")
 
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Email/import":
-        return None, None
 
-    created = response_data.get("created", {})
-    if "email" not in created:
-        return None, None
+def _ordered_after(call: list, previous: list) -> list:
+    """Return call with its accountId back-referenced from previous's response.
 
-    email_info = created["email"]
-    return email_info.get("id"), email_info.get("threadId")
+    The dispatcher runs calls without result references in parallel; the
+    reference makes it run call only after previous has completed.
+    """
+    name, args, call_id = call
+    args = {k: v for k, v in args.items() if k != "accountId"}
+    args["#accountId"] = {"resultOf": previous[2], "name": previous[0], "path": "/accountId"}
+    return [name, args, call_id]
 
 
-def get_email_state(api_url: str, token: str, account_id: str) -> str | None:
-    """Get current Email state from Email/get."""
-    email_get_call = [
-        "Email/get",
-        {
-            "accountId": account_id,
-            "ids": [],
-        },
-        "getState0",
-    ]
+def chain_state_mutate(
+    api_url: str,
+    token: str,
+    account_id: str,
+    mutation_call: list,
+    type_name: str = "Email",
+) -> list:
+    """Read state, then apply a mutation, in one JMAP request.
 
-    try:
-        response = make_jmap_request(api_url, token, [email_get_call])
-    except Exception:
-        return None
+    For mutations whose response reports newState themselves (/set,
+    Email/import), this is all that is needed to observe a state change.
 
-    if "methodResponses" not in response:
-        return None
+    Returns the MethodResponse list: [state get, mutation].
+    """
+    state_call = [f"{type_name}/get", {"accountId": account_id, "ids": []}, "s0"]
+    mutation_call = _ordered_after(mutation_call, state_call)
+    return make_jmap_batch(api_url, token, [state_call, mutation_call])
 
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
 
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Email/get":
-        return None
+def chain_state_mutate_changes(
+    api_url: str,
+    token: str,
+    account_id: str,
+    mutation_call: list,
+    type_name: str = "Email",
+) -> list:
+    """Read state, apply a mutation and query changes in one JMAP request.
 
-    return response_data.get("state")
+    Sends ``{type_name}/get`` (for its state), the mutation, then
+    ``{type_name}/changes`` with ``sinceState`` taken from the first response.
+    The dispatcher runs independent calls in parallel, so each call takes its
+    accountId from the previous response to keep the three strictly ordered.
 
+    Returns the MethodResponse list: [state get, mutation, changes].
+    """
+    state_call = [f"{type_name}/get", {"accountId": account_id, "ids": []}, "s0"]
+    mutation_call = _ordered_after(mutation_call, state_call)
+    changes_call = _ordered_after(
+        [
+            f"{type_name}/changes",
+            {
+                "accountId": account_id,
+                "#sinceState": {"resultOf": "s0", "name": f"{type_name}/get", "path": "/state"},
+            },
+            "c0",
+        ],
+        mutation_call,
+    )
+    return make_jmap_batch(api_url, token, [state_call, mutation_call, changes_call])
 
-def get_mailbox_state(api_url: str, token: str, account_id: str) -> str | None:
-    """Get current Mailbox state from Mailbox/get."""
-    mailbox_get_call = [
-        "Mailbox/get",
-        {
-            "accountId": account_id,
-            "ids": [],
-        },
-        "getState0",
-    ]
 
-    try:
-        response = make_jmap_request(api_url, token, [mailbox_get_call])
-    except Exception:
-        return None
+def chain_state_mutate_state(
+    api_url: str,
+    token: str,
+    account_id: str,
+    mutation_call: list,
+    type_name: str = "Email",
+) -> list:
+    """Read state, apply a mutation and read state again in one JMAP request.
 
-    if "methodResponses" not in response:
-        return None
+    Calls are kept in order the same way as chain_state_mutate_changes.
 
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
+    Returns the MethodResponse list: [state get, mutation, state get].
+    """
+    state_call = [f"{type_name}/get", {"accountId": account_id, "ids": []}, "s0"]
+    mutation_call = _ordered_after(mutation_call, state_call)
+    new_state_call = _ordered_after(
+        [f"{type_name}/get", {"accountId": account_id, "ids": []}, "s1"], mutation_call
+    )
+    return make_jmap_batch(api_url, token, [state_call, mutation_call, new_state_call])
 
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Mailbox/get":
-        return None
 
-    return response_data.get("state")
+def chain_changes_pages(
+    api_url: str,
+    token: str,
+    account_id: str,
+    since_state: str,
+    pages: int,
+    max_changes: int = 1,
+    type_name: str = "Email",
+) -> list:
+    """Walk up to ``pages`` pages of ``{type_name}/changes`` in one JMAP request.
 
+    Page i takes ``sinceState`` from page i-1's ``newState``, which also keeps
+    the pages in order. Pages after the last change come back empty.
 
-def get_thread_state(api_url: str, token: str, account_id: str) -> str | None:
-    """Get current Thread state from Thread/get."""
-    thread_get_call = [
-        "Thread/get",
+    Returns the MethodResponse list, one per page.
+    """
+    changes_calls = [
+        [
+            f"{type_name}/changes",
+            {"accountId": account_id, "sinceState": since_state, "maxChanges": max_changes},
+            "p0",
+        ]
+    ]
+    for i in range(1, pages):
+        changes_calls.append(
+            [
+                f"{type_name}/changes",
+                {
+                    "accountId": account_id,
+                    "#sinceState": {
+                        "resultOf": f"p{i - 1}",
+                        "name": f"{type_name}/changes",
+                        "path": "/newState",
+                    },
+                    "maxChanges": max_changes,
+                },
+                f"p{i}",
+            ]
+        )
+    return make_jmap_batch(api_url, token, changes_calls)
+
+
+def _get_state(api_url: str, token: str, account_id: str, type_name: str) -> str | None:
+    """Get current state for type_name from {type_name}/get with no ids."""
+    state_call = [
+        f"{type_name}/get",
         {
             "accountId": account_id,
             "ids": [],
@@ -394,23 +738,27 @@ def get_thread_state(api_url: str, token: str, account_id: str) -> str | None:
         "getState0",
     ]
 
-    try:
-        response = make_jmap_request(api_url, token, [thread_get_call])
-    except Exception:
+    result = _single_response(api_url, token, state_call)
+    if result is None:
         return None
+    _, response_data = result
 
-    if "methodResponses" not in response:
-        return None
+    return response_data.get("state")
 
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
 
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Thread/get":
-        return None
+def get_email_state(api_url: str, token: str, account_id: str) -> str | None:
+    """Get current Email state from Email/get."""
+    return _get_state(api_url, token, account_id, "Email")
 
-    return response_data.get("state")
+
+def get_mailbox_state(api_url: str, token: str, account_id: str) -> str | None:
+    """Get current Mailbox state from Mailbox/get."""
+    return _get_state(api_url, token, account_id, "Mailbox")
+
+
+def get_thread_state(api_url: str, token: str, account_id: str) -> str | None:
+    """Get current Thread state from Thread/get."""
+    return _get_state(api_url, token, account_id, "Thread")
 
 
 def get_mailbox_counts(
@@ -427,21 +775,10 @@ def get_mailbox_counts(
         "getMailbox0",
     ]
 
-    try:
-        response = make_jmap_request(api_url, token, [mailbox_get_call])
-    except Exception:
-        return None
-
-    if "methodResponses" not in response:
-        return None
-
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
-
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Mailbox/get":
+    result = _single_response(api_url, token, mailbox_get_call)
+    if result is None:
         return None
+    _, response_data = result
 
     mailboxes = response_data.get("list", [])
     if not mailboxes:
@@ -495,21 +832,10 @@ def get_email_mailbox_ids(
         "getEmail0",
     ]
 
-    try:
-        response = make_jmap_request(api_url, token, [email_get_call])
-    except Exception:
-        return None
-
-    if "methodResponses" not in response:
-        return None
-
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
-
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Email/get":
+    result = _single_response(api_url, token, email_get_call)
+    if result is None:
         return None
+    _, response_data = result
 
     emails = response_data.get("list", [])
     if not emails:
@@ -532,21 +858,10 @@ def get_email_keywords(
         "getEmail0",
     ]
 
-    try:
-        response = make_jmap_request(api_url, token, [email_get_call])
-    except Exception:
-        return None
-
-    if "methodResponses" not in response:
-        return None
-
-    method_responses = response["methodResponses"]
-    if len(method_responses) == 0:
-        return None
-
-    response_name, response_data, _ = method_responses[0]
-    if response_name != "Email/get":
+    result = _single_response(api_url, token, email_get_call)
+    if result is None:
         return None
+    _, response_data = result
 
     emails = response_data.get("list", [])
     if not emails:
@@ -709,46 +1024,62 @@ def destroy_emails_and_verify_cleanup(
 
     print(f"destroy_emails_and_verify_cleanup: Destroying {len(email_ids)} emails")
 
-    # Step 1: Get blobIds for the emails
-    blob_ids = []
-    email_get_call = [
-        "Email/get",
-        {
-            "accountId": account_id,
-            "ids": email_ids,
-            "properties": ["blobId"],
-        },
-        "getBlobIds",
-    ]
-    try:
-        get_response = make_jmap_request(api_url, token, [email_get_call])
-        if "methodResponses" in get_response:
-            resp_name, resp_data, _ = get_response["methodResponses"][0]
-            if resp_name == "Email/get":
-                for email in resp_data.get("list", []):
-                    bid = email.get("blobId")
-                    if bid:
-                        blob_ids.append(bid)
-    except Exception:
-        pass  # Non-fatal
-
-    # Step 2: Call Email/set destroy
-    email_set_call = [
-        "Email/set",
-        {
-            "accountId": account_id,
-            "destroy": email_ids,
-        },
-        "destroyEmails",
+    # Get blobIds, destroy, and verify in one request. The verify call
+    # back-references the ids Email/set reports as destroyed. Calls without a
+    # result reference may run in parallel, so the destroy takes its
+    # accountId from the blobId lookup to make sure that runs first.
+    method_calls = [
+        [
+            "Email/get",
+            {
+                "accountId": account_id,
+                "ids": email_ids,
+                "properties": ["blobId"],
+            },
+            "getBlobIds",
+        ],
+        [
+            "Email/set",
+            {
+                "#accountId": {
+                    "resultOf": "getBlobIds",
+                    "name": "Email/get",
+                    "path": "/accountId",
+                },
+                "destroy": email_ids,
+            },
+            "destroyEmails",
+        ],
+        [
+            "Email/get",
+            {
+                "accountId": account_id,
+                "#ids": {
+                    "resultOf": "destroyEmails",
+                    "name": "Email/set",
+                    "path": "/destroyed",
+                },
+            },
+            "verifyDestroyed",
+        ],
     ]
 
-    response = make_jmap_request(api_url, token, [email_set_call])
-    assert "methodResponses" in response, f"No methodResponses: {response}"
-
-    method_responses = response["methodResponses"]
+    method_responses = make_jmap_batch(api_url, token, method_calls)
     assert len(method_responses) > 0, "Empty methodResponses"
+    by_call_id = {call_id: (name, data) for name, data, call_id in method_responses}
 
-    response_name, response_data, _ = method_responses[0]
+    # Step 1: Collect blobIds (non-fatal if missing)
+    blob_ids = []
+    resp_name, resp_data = by_call_id.get("getBlobIds", (None, {}))
+    if resp_name == "Email/get":
+        for email in resp_data.get("list", []):
+            bid = email.get("blobId")
+            if bid:
+                blob_ids.append(bid)
+
+    # Step 2: Check Email/set destroy
+    assert "destroyEmails" in by_call_id, f"No Email/set response: {method_responses}"
+    response_name, response_data = by_call_id["destroyEmails"]
     assert response_name != "error", (
         f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
     )
@@ -765,28 +1096,12 @@ def destroy_emails_and_verify_cleanup(
     )
 
     # Step 3: Verify emails are gone
-    verify_get_call = [
-        "Email/get",
-        {
-            "accountId": account_id,
-            "ids": email_ids,
-        },
-        "verifyDestroyed",
-    ]
-
-    try:
-        verify_response = make_jmap_request(api_url, token, [verify_get_call])
-        if "methodResponses" in verify_response:
-            resp_name, resp_data, _ = verify_response["methodResponses"][0]
-            if resp_name == "Email/get":
-                not_found = resp_data.get("notFound", [])
-                assert set(not_found) == set(email_ids), (
-                    f"Expected all in notFound, got notFound={not_found}"
-                )
-    except AssertionError:
-        raise
-    except Exception:
-        pass  # Non-fatal verification
+    resp_name, resp_data = by_call_id.get("verifyDestroyed", (None, {}))
+    if resp_name == "Email/get":
+        not_found = resp_data.get("notFound", [])
+        assert set(not_found) == set(email_ids), (
+            f"Expected all in notFound, got notFound={not_found}"
+        )
 
     # Step 4: Verify blob cleanup via DELETE endpoint
     if not blob_ids:
@@ -794,10 +1109,10 @@ def destroy_emails_and_verify_cleanup(
 
     base_url = api_url.rsplit("/jmap", 1)[0]
 
-    for blob_id in blob_ids:
+    def _delete_one(blob_id: str) -> None:
         delete_url = f"{base_url}/delete/{account_id}/{blob_id}"
         try:
-            resp = requests.delete(
+            resp = HTTP_SESSION.delete(
                 delete_url,
                 headers={"Authorization": f"Bearer {token}"},
                 timeout=30,
@@ -809,3 +1124,8 @@ def destroy_emails_and_verify_cleanup(
             raise
         except Exception:
             pass  # Non-fatal
+
+    # Blob deletes are independent, so overlap their round trips. Leaving the
+    # with-block waits for every delete before the first failure is raised.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_delete_one, blob_ids))
@@ -5,15 +5,23 @@ Tests for the upload-put extension (https://jmap.rrod.net/extensions/upload-put)
 that enables direct upload to S3 via pre-signed URLs.
 """
 
-import os
+import functools
+import hashlib
+import io
+import random
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+import orjson
 import pytest
 import requests
 
-from helpers import make_iam_jmap_request, make_jmap_request
+from helpers import HTTP_SESSION, JSON_CONTENT_TYPE, make_iam_jmap_request, make_jmap_request
+
+
+pytestmark = pytest.mark.xdist_group(name=__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -22,6 +30,25 @@ from helpers import make_iam_jmap_request, make_jmap_request
 
 UPLOAD_PUT_CAPABILITY = "https://jmap.rrod.net/extensions/upload-put"
 
+# Multipart creation requests that Cognito-authenticated callers must have
+# rejected, whatever else is wrong with them.
+COGNITO_MULTIPART_CREATES = [
+    {"type": "application/octet-stream", "size": 0, "multipart": True},
+    {"type": "application/octet-stream", "size": -1, "multipart": True},
+    {"type": "application/octet-stream", "size": 1024, "multipart": True},
+    {"size": 0, "multipart": True},
+]
+
+# (size, seed) of the multipart test's parts: 5 MiB (the S3 minimum for a
+# non-last part) then 1 KiB
+MULTIPART_PART_SPECS = ((5 * 1024 * 1024, 0), (1024, 1))
+
+# META# update that reverses pending allocations; callers supply
+# ExpressionAttributeValues {":neg": -count, ":size": total_size}.
+CLEANUP_META_UPDATE = {
+    "UpdateExpression": "ADD pendingAllocationsCount :neg, quotaRemaining :size",
+}
+
 
 # ---------------------------------------------------------------------------
 # Module-level helpers
@@ -47,71 +74,175 @@ def make_allocate_request(
             ]
         ],
     }
-    response = requests.post(
+    response = HTTP_SESSION.post(
         api_url,
         headers={
             "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
+            "Content-Type": JSON_CONTENT_TYPE,
         },
-        json=request_body,
+        data=orjson.dumps(request_body),
         timeout=30,
     )
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def get_dynamodb_blob(table: str, account_id: str, blob_id: str, region: str) -> dict | None:
-    """Get DynamoDB blob record."""
-    dynamodb = boto3.resource("dynamodb", region_name=region)
-    tbl = dynamodb.Table(table)
-    response = tbl.get_item(Key={"pk": f"ACCOUNT#{account_id}", "sk": f"BLOB#{blob_id}"})
-    return response.get("Item")
+@functools.lru_cache(maxsize=None)
+def _ddb_resource(region: str):
+    """Return a DynamoDB resource for the region, created once per process."""
+    return boto3.resource("dynamodb", region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def _ddb_client(region: str):
+    """Return a low-level DynamoDB client for the region, created once per process."""
+    return boto3.client("dynamodb", region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def _ddb_table(region: str, table: str):
+    """Return a cached DynamoDB Table object."""
+    return _ddb_resource(region).Table(table)
+
+
+def is_blob_confirmed(table: str, account_id: str, blob_id: str, region: str) -> bool:
+    """Check whether a DynamoDB blob record has status "confirmed".
+
+    The comparison runs server-side as a Query filter with Select=COUNT, so no
+    item attributes are returned or unmarshalled. It uses the low-level client
+    since it is polled.
+    """
+    response = _ddb_client(region).query(
+        TableName=table,
+        KeyConditionExpression="pk = :pk AND sk = :sk",
+        FilterExpression="#s = :confirmed",
+        ExpressionAttributeNames={"#s": "status"},
+        ExpressionAttributeValues={
+            ":pk": {"S": f"ACCOUNT#{account_id}"},
+            ":sk": {"S": f"BLOB#{blob_id}"},
+            ":confirmed": {"S": "confirmed"},
+        },
+        Select="COUNT",
+    )
+    return response["Count"] > 0
 
 
 def get_dynamodb_meta(table: str, account_id: str, region: str) -> dict | None:
     """Get DynamoDB META# record for account."""
-    dynamodb = boto3.resource("dynamodb", region_name=region)
-    tbl = dynamodb.Table(table)
-    response = tbl.get_item(Key={"pk": f"ACCOUNT#{account_id}", "sk": "META#"})
+    response = _ddb_table(region, table).get_item(Key={"pk": f"ACCOUNT#{account_id}", "sk": "META#"})
     return response.get("Item")
 
 
-def delete_blob(jmap_client, token: str, account_id: str, blob_id: str) -> requests.Response:
+def wait_for_confirmed(
+    table: str,
+    account_id: str,
+    blob_id: str,
+    region: str,
+    max_wait: float = 30,
+) -> bool:
+    """Poll the BLOB# record until its status is confirmed.
+
+    Backs off exponentially from 250ms up to 2s between polls so fast
+    confirmations return quickly. Returns False if not confirmed within
+    max_wait seconds (or if no table is configured).
+    """
+    if not table:
+        return False
+
+    deadline = time.monotonic() + max_wait
+    attempt = 0
+    while True:
+        if is_blob_confirmed(table, account_id, blob_id, region):
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+
+        time.sleep(min(2.0, 0.25 * (1.5 ** attempt), remaining))
+        attempt += 1
+
+
+def delete_blob(delete_url_template: str, token: str, blob_id: str) -> requests.Response:
     """Send DELETE /delete/{accountId}/{blobId} with bearer token."""
-    download_url = jmap_client.jmap_session.download_url
-    delete_url_template = download_url.replace("/download/", "/delete/")
-    url = delete_url_template.replace("{accountId}", account_id).replace("{blobId}", blob_id)
-    return requests.delete(
-        url,
+    return HTTP_SESSION.delete(
+        delete_url_template.replace("{blobId}", blob_id),
         headers={"Authorization": f"Bearer {token}"},
         timeout=30,
     )
 
 
-def download_blob(jmap_client, token: str, account_id: str, blob_id: str) -> bytes | None:
+def _safe_delete(delete_url_template: str, token: str, blob_id: str) -> None:
+    """Best-effort blob delete for teardown; errors are ignored."""
+    try:
+        delete_blob(delete_url_template, token, blob_id)
+    except Exception:
+        pass
+
+
+def delete_blobs(delete_url_template: str, token: str, blob_ids: list[str]) -> None:
+    """Delete blobs concurrently, ignoring failures (teardown cleanup)."""
+    if not blob_ids:
+        return
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda blob_id: _safe_delete(delete_url_template, token, blob_id),
+            blob_ids,
+        ))
+
+
+def download_blob(download_url_template: str, token: str, blob_id: str) -> bytes | None:
     """Download a blob and return its content."""
-    download_url = jmap_client.jmap_session.download_url
-    url = download_url.replace("{accountId}", account_id).replace("{blobId}", blob_id)
+    url = download_url_template.replace("{blobId}", blob_id)
 
-    # Get redirect to signed URL
-    response = requests.get(
+    # The endpoint redirects to a signed S3 URL; requests drops the
+    # Authorization header itself when the redirect changes host.
+    response = HTTP_SESSION.get(
         url,
         headers={"Authorization": f"Bearer {token}"},
-        allow_redirects=False,
+        allow_redirects=True,
         timeout=30,
     )
-    if response.status_code != 302:
+    if response.status_code != 200:
         return None
 
-    location = response.headers.get("Location")
-    if not location:
-        return None
+    return response.content
 
-    # Follow the signed URL
-    content_response = requests.get(location, timeout=30)
-    if content_response.status_code != 200:
-        return None
 
-    return content_response.content
+def download_blob_into(
+    download_url_template: str, token: str, blob_id: str, size: int
+) -> memoryview | None:
+    """Stream a blob into a preallocated buffer of the expected size.
+
+    Returns a view of the bytes received (shorter than size if the blob is
+    smaller), or None if the download fails or the blob is larger than size.
+    """
+    url = download_url_template.replace("{blobId}", blob_id)
+
+    with HTTP_SESSION.get(
+        url,
+        headers={"Authorization": f"Bearer {token}"},
+        allow_redirects=True,
+        stream=True,
+        timeout=30,
+    ) as response:
+        if response.status_code != 200:
+            return None
+
+        # Blob bodies are opaque bytes: read the raw stream straight into the
+        # buffer, skipping requests' content decoding and chunk staging
+        response.raw.decode_content = False
+        buf = memoryview(bytearray(size))
+        offset = 0
+        while offset < size:
+            read = response.raw.readinto(buf[offset:])
+            if not read:
+                break
+            offset += read
+
+        if offset == size and response.raw.read(1):
+            return None
+
+    return buf[:offset]
 
 
 def cleanup_pending_allocation(
@@ -127,18 +258,120 @@ def cleanup_pending_allocation(
     Use this in tests that intentionally don't complete upload (e.g., testing
     allocation only, or testing S3 rejection scenarios).
     """
-    dynamodb = boto3.resource("dynamodb", region_name=region)
-    tbl = dynamodb.Table(table)
+    pk = {"S": f"ACCOUNT#{account_id}"}
 
-    # Delete the pending blob record
-    tbl.delete_item(Key={"pk": f"ACCOUNT#{account_id}", "sk": f"BLOB#{blob_id}"})
+    # Delete the pending blob record and update META# (decrement pending count,
+    # restore quota) atomically in a single call
+    _ddb_client(region).transact_write_items(
+        TransactItems=[
+            {
+                "Delete": {
+                    "TableName": table,
+                    "Key": {"pk": pk, "sk": {"S": f"BLOB#{blob_id}"}},
+                }
+            },
+            {
+                "Update": {
+                    "TableName": table,
+                    "Key": {"pk": pk, "sk": {"S": "META#"}},
+                    **CLEANUP_META_UPDATE,
+                    "ExpressionAttributeValues": {
+                        ":neg": {"N": "-1"},
+                        ":size": {"N": str(size)},
+                    },
+                }
+            },
+        ]
+    )
+
+
+def cleanup_pending_allocations_bulk(
+    table: str, account_id: str, blob_ids_and_sizes: list[tuple[str, int]], region: str
+) -> None:
+    """Clean up several pending allocations at once.
+
+    Same as cleanup_pending_allocation, but deletes the BLOB# records through
+    a batch writer and applies a single META# update for the totals.
+    """
+    if not blob_ids_and_sizes:
+        return
+
+    tbl = _ddb_table(region, table)
+
+    with tbl.batch_writer() as batch:
+        for blob_id, _ in blob_ids_and_sizes:
+            batch.delete_item(Key={"pk": f"ACCOUNT#{account_id}", "sk": f"BLOB#{blob_id}"})
 
-    # Update META#: decrement pending count, restore quota
     tbl.update_item(
         Key={"pk": f"ACCOUNT#{account_id}", "sk": "META#"},
-        UpdateExpression="ADD pendingAllocationsCount :neg, quotaRemaining :size",
-        ExpressionAttributeValues={":neg": -1, ":size": size},
+        **CLEANUP_META_UPDATE,
+        ExpressionAttributeValues={
+            ":neg": -len(blob_ids_and_sizes),
+            ":size": sum(size for _, size in blob_ids_and_sizes),
+        },
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def make_payload(size: int, seed: int = 0) -> bytes:
+    """Deterministic pseudo-random payload for content-equality checks.
+
+    A seeded PRNG is plenty for comparing uploaded and downloaded bytes, and
+    avoids pulling megabytes from the OS CSPRNG. Cached so repeated calls
+    reuse the same buffer.
+    """
+    return random.Random(seed).randbytes(size)
+
+
+@functools.lru_cache(maxsize=None)
+def payload_sha256(*parts: tuple[int, int]) -> bytes:
+    """SHA-256 of the concatenation of make_payload(size, seed) for each part.
+
+    Computed once per set of (size, seed) specs, without building the
+    concatenated bytes.
+    """
+    digest = hashlib.sha256()
+    for size, seed in parts:
+        digest.update(make_payload(size, seed))
+    return digest.digest()
+
+
+def _put_part(part_info: dict, payload: bytes) -> dict:
+    """PUT one multipart part to its pre-signed URL and return its completion entry."""
+    # Stream from a BytesIO (which shares the bytes buffer) rather than handing
+    # requests the bytes object, so large parts aren't copied into a send buffer.
+    put_resp = HTTP_SESSION.put(
+        part_info["url"],
+        data=io.BytesIO(payload),
+        headers={"Content-Length": str(len(payload))},
+        timeout=120,
+    )
+    assert put_resp.status_code in (200, 204), (
+        f"PUT part {part_info['partNumber']} failed: "
+        f"{put_resp.status_code} {put_resp.text}"
     )
+    etag = put_resp.headers.get("ETag")
+    assert etag, f"No ETag in response for part {part_info['partNumber']}"
+    return {"partNumber": part_info["partNumber"], "etag": etag}
+
+
+@pytest.fixture(scope="class")
+def _record_blob(blob_url_templates, token):
+    """Class-scoped recorder for blob IDs to delete after the class.
+
+    Yields a callable that tracks a blob ID (None is ignored). The list lives in
+    the fixture rather than on the test class, so no state is shared between
+    classes.
+    """
+    blob_ids: list[str] = []
+
+    def record(blob_id: str | None) -> None:
+        if blob_id:
+            blob_ids.append(blob_id)
+
+    yield record
+    # Cleanup (best effort)
+    delete_blobs(blob_url_templates["delete"], token, blob_ids)
 
 
 # ---------------------------------------------------------------------------
@@ -148,35 +381,9 @@ def cleanup_pending_allocation(
 class TestBlobAllocate:
     """Tests for Blob/allocate extension."""
 
-    @pytest.fixture(scope="class", autouse=True)
-    def _cleanup_blobs(self, jmap_client, token, account_id):
-        """Class-scoped fixture that cleans up all tracked blobs after the class."""
-        blob_ids: list[str] = []
-        TestBlobAllocate._class_blob_ids = blob_ids
-        yield
-        # Cleanup
-        for blob_id in blob_ids:
-            try:
-                delete_blob(jmap_client, token, account_id, blob_id)
-            except Exception:
-                pass  # Best effort cleanup
-
-    def _record_blob(self, blob_id: str | None):
-        """Record a blob ID for cleanup."""
-        if blob_id:
-            TestBlobAllocate._class_blob_ids.append(blob_id)
-
-    def test_capability_in_session(self, jmap_host, token, account_id):
+    def test_capability_in_session(self, jmap_session_doc, account_id):
         """Session includes upload-put capability with required properties."""
-        # Make raw HTTP request to get session (jmapc doesn't expose raw accounts)
-        session_url = f"https://{jmap_host}/.well-known/jmap"
-        response = requests.get(
-            session_url,
-            headers={"Authorization": f"Bearer {token}", "X-JMAP-Stage": "e2e"},
-            timeout=30,
-        )
-        assert response.status_code == 200, f"Session request failed: {response.status_code}"
-        session_data = response.json()
+        session_data = jmap_session_doc
 
         # Check session-level capability
         assert "capabilities" in session_data, "No capabilities in session"
@@ -202,7 +409,7 @@ class TestBlobAllocate:
         assert "maxPendingAllocations" in cap_config, \
             "Account capability missing maxPendingAllocations"
 
-    def test_allocate_success(self, api_url, token, account_id, dynamodb_table, aws_region):
+    def test_allocate_success(self, _record_blob, api_url, token, account_id, dynamodb_table, aws_region):
         """Blob/allocate returns valid response with URL and expiry."""
         alloc_size = 1024
         response = make_allocate_request(
@@ -237,7 +444,7 @@ class TestBlobAllocate:
         url = allocation["url"]
         assert url.startswith("https://"), f"URL not HTTPS: {url}"
 
-        self._record_blob(allocation["id"])
+        _record_blob(allocation["id"])
 
         # Clean up pending allocation since we don't upload
         if dynamodb_table:
@@ -245,7 +452,8 @@ class TestBlobAllocate:
                 dynamodb_table, account_id, allocation["id"], alloc_size, aws_region
             )
 
-    def test_allocate_then_upload(self, jmap_client, api_url, token, account_id,
+    def test_allocate_then_upload(self, _record_blob, blob_url_templates,
+                                   api_url, token, account_id,
                                    dynamodb_table, aws_region):
         """Full flow: allocate -> PUT upload -> blob accessible."""
         test_content = b"Test content for blob allocate upload verification"
@@ -270,10 +478,10 @@ class TestBlobAllocate:
         allocation = created["upload0"]
         blob_id = allocation["id"]
         upload_url = allocation["url"]
-        self._record_blob(blob_id)
+        _record_blob(blob_id)
 
         # Step 2: PUT to pre-signed URL
-        put_response = requests.put(
+        put_response = HTTP_SESSION.put(
             upload_url,
             headers={
                 "Content-Type": content_type,
@@ -287,37 +495,19 @@ class TestBlobAllocate:
 
         # Step 3: Wait for blob-confirm to process
         max_wait = 30
-        poll_interval = 2
-        elapsed = 0
-        blob_confirmed = False
-
-        while elapsed < max_wait and not blob_confirmed:
-            time.sleep(poll_interval)
-            elapsed += poll_interval
-
-            if dynamodb_table:
-                item = get_dynamodb_blob(dynamodb_table, account_id, blob_id, aws_region)
-                if item and item.get("status") == "confirmed":
-                    blob_confirmed = True
-
+        blob_confirmed = wait_for_confirmed(
+            dynamodb_table, account_id, blob_id, aws_region, max_wait=max_wait
+        )
         assert blob_confirmed, f"Blob {blob_id} not confirmed after {max_wait}s"
 
         # Step 4: Verify blob is downloadable
-        downloaded_content = download_blob(jmap_client, token, account_id, blob_id)
+        downloaded_content = download_blob(blob_url_templates["download"], token, blob_id)
         assert downloaded_content == test_content, \
             f"Downloaded content mismatch: expected {len(test_content)} bytes, got {len(downloaded_content) if downloaded_content else 0}"
 
-    def test_allocate_too_large(self, jmap_host, api_url, token, account_id):
+    def test_allocate_too_large(self, jmap_session_doc, api_url, token, account_id):
         """Blob/allocate returns tooLarge error for oversized requests."""
-        # Get capability config via raw HTTP request
-        session_url = f"https://{jmap_host}/.well-known/jmap"
-        session_resp = requests.get(
-            session_url,
-            headers={"Authorization": f"Bearer {token}", "X-JMAP-Stage": "e2e"},
-            timeout=30,
-        )
-        session_data = session_resp.json()
-        account = session_data["accounts"].get(account_id, {})
+        account = jmap_session_doc["accounts"].get(account_id, {})
         cap_config = account.get("accountCapabilities", {}).get(UPLOAD_PUT_CAPABILITY, {})
         max_size = cap_config.get("maxSizeUploadPut", 250000000)
 
@@ -364,7 +554,7 @@ class TestBlobAllocate:
         assert error.get("type") == "invalidProperties", \
             f"Expected invalidProperties error, got: {error.get('type')}"
 
-    def test_upload_content_type_mismatch(self, api_url, token, account_id,
+    def test_upload_content_type_mismatch(self, _record_blob, api_url, token, account_id,
                                           dynamodb_table, aws_region):
         """S3 rejects upload with mismatched Content-Type."""
         alloc_size = 10
@@ -387,10 +577,10 @@ class TestBlobAllocate:
         allocation = created["mismatch"]
         upload_url = allocation["url"]
         blob_id = allocation["id"]
-        self._record_blob(blob_id)
+        _record_blob(blob_id)
 
         # Upload with different type
-        put_response = requests.put(
+        put_response = HTTP_SESSION.put(
             upload_url,
             headers={
                 "Content-Type": "application/json",  # Different from declared
@@ -410,7 +600,7 @@ class TestBlobAllocate:
                 dynamodb_table, account_id, blob_id, alloc_size, aws_region
             )
 
-    def test_upload_size_mismatch(self, api_url, token, account_id,
+    def test_upload_size_mismatch(self, _record_blob, api_url, token, account_id,
                                    dynamodb_table, aws_region):
         """S3 rejects upload with mismatched Content-Length."""
         declared_size = 10
@@ -433,10 +623,10 @@ class TestBlobAllocate:
         allocation = created["sizemis"]
         upload_url = allocation["url"]
         blob_id = allocation["id"]
-        self._record_blob(blob_id)
+        _record_blob(blob_id)
 
         # Upload with different size
-        put_response = requests.put(
+        put_response = HTTP_SESSION.put(
             upload_url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -456,7 +646,7 @@ class TestBlobAllocate:
                 dynamodb_table, account_id, blob_id, declared_size, aws_region
             )
 
-    def test_allocate_multiple(self, api_url, token, account_id,
+    def test_allocate_multiple(self, _record_blob, api_url, token, account_id,
                                 dynamodb_table, aws_region):
         """Blob/allocate handles multiple allocations in single request."""
         first_size = 100
@@ -483,8 +673,8 @@ class TestBlobAllocate:
         second_id = created["second"]["id"]
 
         # Record for cleanup
-        self._record_blob(first_id)
-        self._record_blob(second_id)
+        _record_blob(first_id)
+        _record_blob(second_id)
 
         # Verify each has unique id and url
         assert first_id != second_id, "Both allocations have same id"
@@ -493,14 +683,14 @@ class TestBlobAllocate:
 
         # Clean up pending allocations since we don't upload
         if dynamodb_table:
-            cleanup_pending_allocation(
-                dynamodb_table, account_id, first_id, first_size, aws_region
-            )
-            cleanup_pending_allocation(
-                dynamodb_table, account_id, second_id, second_size, aws_region
+            cleanup_pending_allocations_bulk(
+                dynamodb_table,
+                account_id,
+                [(first_id, first_size), (second_id, second_size)],
+                aws_region,
             )
 
-    def test_missing_capability_in_using(self, api_url, token, account_id):
+    def test_missing_capability_in_using(self, jmap_api_session, api_url, account_id):
         """Request without capability in using array returns error."""
         # Make request WITHOUT the upload-put capability in using array
         request_body = {
@@ -516,16 +706,13 @@ class TestBlobAllocate:
                 ]
             ],
         }
-        response = requests.post(
+        response = jmap_api_session.post(
             api_url,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-            json=request_body,
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+            data=orjson.dumps(request_body),
             timeout=30,
         )
-        resp_json = response.json()
+        resp_json = orjson.loads(response.content)
 
         assert "methodResponses" in resp_json
         name, data, _ = resp_json["methodResponses"][0]
@@ -547,36 +734,10 @@ class TestBlobAllocateLimits:
     to be skipped if the account doesn't have appropriate limits configured.
     """
 
-    @pytest.fixture(scope="class", autouse=True)
-    def _cleanup_blobs(self, jmap_client, token, account_id):
-        """Class-scoped fixture that cleans up all tracked blobs after the class."""
-        blob_ids: list[str] = []
-        TestBlobAllocateLimits._class_blob_ids = blob_ids
-        yield
-        # Cleanup - delete all tracked blobs
-        for blob_id in blob_ids:
-            try:
-                delete_blob(jmap_client, token, account_id, blob_id)
-            except Exception:
-                pass
-
-    def _record_blob(self, blob_id: str | None):
-        """Record a blob ID for cleanup."""
-        if blob_id:
-            TestBlobAllocateLimits._class_blob_ids.append(blob_id)
-
-    def test_allocate_too_many_pending(self, jmap_host, jmap_client, api_url, token, account_id,
+    def test_allocate_too_many_pending(self, _record_blob, jmap_session_doc, api_url, token, account_id,
                                         dynamodb_table, aws_region):
         """Blob/allocate returns tooManyPending when limit exceeded."""
-        # Get capability config via raw HTTP request (jmapc doesn't expose raw accounts)
-        session_url = f"https://{jmap_host}/.well-known/jmap"
-        session_resp = requests.get(
-            session_url,
-            headers={"Authorization": f"Bearer {token}", "X-JMAP-Stage": "e2e"},
-            timeout=30,
-        )
-        session_data = session_resp.json()
-        account = session_data["accounts"].get(account_id, {})
+        account = jmap_session_doc["accounts"].get(account_id, {})
         cap_config = account.get("accountCapabilities", {}).get(UPLOAD_PUT_CAPABILITY, {})
         max_pending = cap_config.get("maxPendingAllocations", 4)
 
@@ -595,7 +756,7 @@ class TestBlobAllocateLimits:
         # Record any created for cleanup
         created = data.get("created", {})
         for key, alloc in created.items():
-            self._record_blob(alloc.get("id"))
+            _record_blob(alloc.get("id"))
 
         # Should have some notCreated with tooManyPending
         not_created = data.get("notCreated", {})
@@ -618,10 +779,12 @@ class TestBlobAllocateLimits:
 
         # Clean up all created pending allocations since we don't upload
         if dynamodb_table:
-            for key, alloc in created.items():
-                cleanup_pending_allocation(
-                    dynamodb_table, account_id, alloc["id"], alloc_size, aws_region
-                )
+            cleanup_pending_allocations_bulk(
+                dynamodb_table,
+                account_id,
+                [(alloc["id"], alloc_size) for alloc in created.values()],
+                aws_region,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -631,25 +794,9 @@ class TestBlobAllocateLimits:
 class TestBlobMultipartUpload:
     """Tests for the multipart upload flow: Blob/allocate(multipart) → S3 parts → Blob/complete."""
 
-    @pytest.fixture(scope="class", autouse=True)
-    def _cleanup_blobs(self, jmap_client, token, account_id):
-        """Class-scoped fixture that cleans up all tracked blobs after the class."""
-        blob_ids: list[str] = []
-        TestBlobMultipartUpload._class_blob_ids = blob_ids
-        yield
-        for blob_id in blob_ids:
-            try:
-                delete_blob(jmap_client, token, account_id, blob_id)
-            except Exception:
-                pass
-
-    def _record_blob(self, blob_id: str | None):
-        """Record a blob ID for cleanup."""
-        if blob_id:
-            TestBlobMultipartUpload._class_blob_ids.append(blob_id)
-
     def test_multipart_allocate_upload_complete(
-        self, jmap_client, api_url, token, account_id,
+        self, _record_blob, blob_url_templates,
+        api_url, token, account_id,
         api_gateway_invoke_url, e2e_test_role_arn, dynamodb_table, aws_region,
     ):
         """Full multipart flow: allocate → upload parts to S3 → Blob/complete → verify."""
@@ -694,7 +841,7 @@ class TestBlobMultipartUpload:
 
         allocation = created["mp0"]
         blob_id = allocation["id"]
-        self._record_blob(blob_id)
+        _record_blob(blob_id)
 
         # Multipart response has parts array, no url
         assert "parts" in allocation, f"No parts in multipart allocation: {allocation}"
@@ -707,28 +854,12 @@ class TestBlobMultipartUpload:
             assert "url" in part, f"Part missing url: {part}"
 
         # Step 2: Upload 2 parts to presigned S3 URLs
-        part1_data = os.urandom(5 * 1024 * 1024)  # 5 MiB (S3 minimum for non-last part)
-        part2_data = os.urandom(1024)               # 1 KiB
+        part_payloads = [make_payload(size, seed) for size, seed in MULTIPART_PART_SPECS]
 
-        part_payloads = [part1_data, part2_data]
-        completed_parts = []
-
-        for i, part_info in enumerate(parts[:2]):
-            put_resp = requests.put(
-                part_info["url"],
-                data=part_payloads[i],
-                timeout=120,
-            )
-            assert put_resp.status_code in (200, 204), (
-                f"PUT part {part_info['partNumber']} failed: "
-                f"{put_resp.status_code} {put_resp.text}"
-            )
-            etag = put_resp.headers.get("ETag")
-            assert etag, f"No ETag in response for part {part_info['partNumber']}"
-            completed_parts.append({
-                "partNumber": part_info["partNumber"],
-                "etag": etag,
-            })
+        part_uploads = list(zip(parts[:2], part_payloads))
+        with ThreadPoolExecutor(max_workers=min(8, len(part_uploads))) as executor:
+            completed_parts = list(executor.map(lambda p: _put_part(*p), part_uploads))
+        completed_parts.sort(key=lambda part: part["partNumber"])
 
         # Step 3: Blob/complete
         complete_response = make_iam_jmap_request(
@@ -758,70 +889,64 @@ class TestBlobMultipartUpload:
 
         # Step 4: Poll DynamoDB for confirmed status
         max_wait = 30
-        poll_interval = 2
-        elapsed = 0
-        blob_confirmed = False
-
-        while elapsed < max_wait and not blob_confirmed:
-            time.sleep(poll_interval)
-            elapsed += poll_interval
-            if dynamodb_table:
-                item = get_dynamodb_blob(dynamodb_table, account_id, blob_id, aws_region)
-                if item and item.get("status") == "confirmed":
-                    blob_confirmed = True
-
+        blob_confirmed = wait_for_confirmed(
+            dynamodb_table, account_id, blob_id, aws_region, max_wait=max_wait
+        )
         assert blob_confirmed, f"Blob {blob_id} not confirmed after {max_wait}s"
 
         # Step 5: Download and verify content
-        downloaded = download_blob(jmap_client, token, account_id, blob_id)
-        expected = part1_data + part2_data
-        assert downloaded is not None, "Download returned None"
-        assert len(downloaded) == len(expected), (
-            f"Size mismatch: expected {len(expected)}, got {len(downloaded)}"
+        expected_size = sum(size for size, _ in MULTIPART_PART_SPECS)
+        downloaded = download_blob_into(
+            blob_url_templates["download"], token, blob_id, expected_size
+        )
+        assert downloaded is not None, "Download failed or exceeded expected size"
+        assert len(downloaded) == expected_size, (
+            f"Size mismatch: expected {expected_size}, got {len(downloaded)}"
         )
-        assert downloaded == expected, "Downloaded content does not match uploaded parts"
 
-    def test_multipart_rejected_for_cognito(self, api_url, token, account_id):
+        # Cheap head/tail spot checks first, then the full digest
+        assert downloaded[:64] == part_payloads[0][:64], \
+            "Downloaded content does not start with the first part"
+        assert downloaded[-64:] == part_payloads[-1][-64:], \
+            "Downloaded content does not end with the last part"
+        assert hashlib.sha256(downloaded).digest() == payload_sha256(*MULTIPART_PART_SPECS), \
+            "Downloaded content does not match uploaded parts"
+
+    def test_multipart_rejected_for_cognito(self, jmap_api_session, api_url, account_id):
         """Blob/allocate with multipart=true is rejected for Cognito auth."""
-        request_body = {
-            "using": ["urn:ietf:params:jmap:core", UPLOAD_PUT_CAPABILITY],
-            "methodCalls": [
-                [
-                    "Blob/allocate",
-                    {
-                        "accountId": account_id,
-                        "create": {
-                            "mp0": {
-                                "type": "application/octet-stream",
-                                "size": 0,
-                                "multipart": True,
-                            },
-                        },
-                    },
-                    "allocate0",
-                ]
-            ],
-        }
-        response = requests.post(
+        # One Blob/allocate call per creation shape, all in a single request
+        method_calls = [
+            [
+                "Blob/allocate",
+                {"accountId": account_id, "create": {"mp0": multipart_create}},
+                f"allocate{i}",
+            ]
+            for i, multipart_create in enumerate(COGNITO_MULTIPART_CREATES)
+        ]
+        response = jmap_api_session.post(
             api_url,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-            json=request_body,
+            headers={"Content-Type": JSON_CONTENT_TYPE},
+            data=orjson.dumps({
+                "using": ["urn:ietf:params:jmap:core", UPLOAD_PUT_CAPABILITY],
+                "methodCalls": method_calls,
+            }),
             timeout=30,
         )
-        resp_json = response.json()
+        resp_json = orjson.loads(response.content)
 
         assert "methodResponses" in resp_json, f"No methodResponses: {resp_json}"
-        name, data, _ = resp_json["methodResponses"][0]
-        assert name == "Blob/allocate", f"Expected Blob/allocate, got {name}: {data}"
+        responses_by_call_id = {
+            call_id: (name, data) for name, data, call_id in resp_json["methodResponses"]
+        }
 
-        not_created = data.get("notCreated")
-        assert not_created is not None, f"Expected notCreated, got: {data}"
-        assert "mp0" in not_created, f"mp0 not in notCreated: {not_created}"
+        for i, multipart_create in enumerate(COGNITO_MULTIPART_CREATES):
+            call_id = f"allocate{i}"
+            assert call_id in responses_by_call_id, \
+                f"No response for {call_id} ({multipart_create}): {resp_json}"
+            name, data = responses_by_call_id[call_id]
+            assert name == "Blob/allocate", f"Expected Blob/allocate, got {name}: {data}"
 
-        error = not_created["mp0"]
-        assert error.get("type") == "invalidArguments", (
-            f"Expected invalidArguments error, got: {error.get('type')}"
-        )
+            error = (data.get("notCreated") or {}).get("mp0") or {}
+            assert error.get("type") == "invalidArguments", (
+                f"Expected invalidArguments error for {multipart_create}, got: {data}"
+            )
@@ -11,35 +11,111 @@ import pytest
 
 from helpers import (
     make_jmap_request,
-    create_test_mailbox,
-    import_test_email,
+    unpack_single_response,
+    setup_changes_test,
     import_email_with_headers,
-    get_email_state,
-    get_mailbox_state,
-    get_thread_state,
-    destroy_emails_and_verify_cleanup,
-    destroy_mailbox,
+    upload_test_email,
+    upload_email_with_headers,
+    make_import_call,
+    chain_state_mutate,
+    chain_state_mutate_changes,
+    chain_state_mutate_state,
+    chain_changes_pages,
+    make_mailbox_create_call,
 )
 
 
+def _check_chained_responses(
+    method_responses: list, expected_methods: list[str], creation_id: str = "email"
+) -> tuple[dict, dict, dict]:
+    """Check a chain_state_mutate* response list against expected_methods.
+
+    The second call is the mutation, which must have created creation_id.
+    Returns (state get data, created object info, last response data).
+    """
+    names = [mr.name for mr in method_responses]
+    assert names == expected_methods, f"Unexpected method responses: {method_responses}"
+
+    state_mr, mutation_mr, last_mr = method_responses[0], method_responses[1], method_responses[-1]
+    created = mutation_mr.data.get("created") or {}
+    assert creation_id in created, f"{mutation_mr.name} did not create {creation_id}: {mutation_mr.data}"
+
+    return state_mr.data, created[creation_id], last_mr.data
+
+
+# Fields every /changes response must carry, with their JSON types
+CHANGES_FIELDS = {
+    "accountId": str,
+    "oldState": str,
+    "newState": str,
+    "hasMoreChanges": bool,
+    "created": list,
+    "updated": list,
+    "destroyed": list,
+}
+
+
+def _collect_changes_pages(method_responses: list, type_name: str, max_changes: int) -> list:
+    """Collect created ids from chain_changes_pages output.
+
+    Asserts no page reports more than max_changes ids in total, and stops
+    after the first page with hasMoreChanges=false.
+    """
+    all_created = []
+    for page, mr in enumerate(method_responses, start=1):
+        assert mr.name == f"{type_name}/changes", f"Unexpected response on page {page}: {mr}"
+        created = mr.data.get("created", [])
+        page_ids = len(created) + len(mr.data.get("updated", [])) + len(mr.data.get("destroyed", []))
+        assert page_ids <= max_changes, (
+            f"page {page} returned {page_ids} IDs (expected <= {max_changes})"
+        )
+        all_created.extend(created)
+        if not mr.data.get("hasMoreChanges"):
+            break
+    return all_created
+
+
+def _check_invalid_state_error(api_url: str, token: str, account_id: str, type_name: str) -> None:
+    """Assert {type_name}/changes rejects a bogus sinceState with cannotCalculateChanges."""
+    changes_call = [
+        f"{type_name}/changes",
+        {"accountId": account_id, "sinceState": "invalid-state-string"},
+        "changes0",
+    ]
+
+    response = make_jmap_request(api_url, token, [changes_call])
+    method_responses = response.get("methodResponses")
+    assert method_responses, f"No methodResponses: {response}"
+
+    response_name, response_data, _ = method_responses[0]
+    assert response_name == "error", f"Expected error response, got {response_name}"
+    assert response_data.get("type") == "cannotCalculateChanges", (
+        f"Expected cannotCalculateChanges, got {response_data.get('type')}"
+    )
+
+
+def _check_changes_structure(response_data: dict, account_id: str, initial_state: str) -> None:
+    """Assert a /changes response has every required field with the right type."""
+    expected = {"accountId": account_id, "oldState": initial_state}
+    errors = []
+    for field, field_type in CHANGES_FIELDS.items():
+        value = response_data.get(field)
+        if value is None:
+            errors.append(f"missing {field}")
+        elif not isinstance(value, field_type):
+            errors.append(f"{field} not a {field_type.__name__}: {type(value)}")
+        elif field in expected and value != expected[field]:
+            errors.append(f"{field} mismatch: expected {expected[field]}, got {value}")
+    assert not errors, "; ".join(errors)
+
+
+@pytest.mark.xdist_group(name="email_changes")
 class TestEmailChanges:
     """Tests for Email/changes (RFC 8620 Section 5.2)."""
 
-    @pytest.fixture(scope="class")
-    def mailbox_and_cleanup(self, api_url, upload_url, token, account_id):
-        """Create a test mailbox and track email IDs for cleanup."""
-        mailbox_id = create_test_mailbox(api_url, token, account_id, prefix="ChangesTest")
-        assert mailbox_id is not None, "Failed to create test mailbox"
-        email_ids = []
-        yield mailbox_id, email_ids
-        if email_ids:
-            destroy_emails_and_verify_cleanup(api_url, token, account_id, email_ids)
-        destroy_mailbox(api_url, token, account_id, mailbox_id, on_destroy_remove_emails=True)
-
-    def test_response_structure(self, api_url, token, account_id):
+    def test_response_structure(self, api_url, token, account_id, initial_email_state):
         """Email/changes response has all required fields (RFC 8620 Section 5.2)."""
-        initial_state = get_email_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial Email state"
+        initial_state = initial_email_state
 
         changes_call = [
             "Email/changes",
@@ -48,57 +124,27 @@ class TestEmailChanges:
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-        )
-        assert response_name == "Email/changes", f"Unexpected method: {response_name}"
-
-        assert response_data.get("accountId") == account_id, (
-            f"accountId mismatch: expected {account_id}, got {response_data.get('accountId')}"
-        )
-        assert response_data.get("oldState") == initial_state, (
-            f"oldState mismatch: expected {initial_state}, got {response_data.get('oldState')}"
-        )
-
-        new_state = response_data.get("newState")
-        assert new_state is not None, "missing newState"
-        assert isinstance(new_state, str), f"newState not a string: {type(new_state)}"
-
-        has_more = response_data.get("hasMoreChanges")
-        assert has_more is not None, "missing hasMoreChanges"
-        assert isinstance(has_more, bool), f"hasMoreChanges not a boolean: {type(has_more)}"
-
-        created = response_data.get("created")
-        assert created is not None, "missing created"
-        assert isinstance(created, list), f"created not an array: {type(created)}"
-
-        updated = response_data.get("updated")
-        assert updated is not None, "missing updated"
-        assert isinstance(updated, list), f"updated not an array: {type(updated)}"
-
-        destroyed = response_data.get("destroyed")
-        assert destroyed is not None, "missing destroyed"
-        assert isinstance(destroyed, list), f"destroyed not an array: {type(destroyed)}"
+        response_data = unpack_single_response(response, "Email/changes")
+        _check_changes_structure(response_data, account_id, initial_state)
 
     def test_state_changes_after_import(self, api_url, upload_url, token, account_id, mailbox_and_cleanup):
         """Email state changes after importing a new email (RFC 8620 Section 5.1)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_email_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
+        blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+        assert blob_id is not None, "Failed to upload test email"
 
-        email_id = import_test_email(api_url, upload_url, token, account_id, mailbox_id)
-        assert email_id is not None, "Failed to import test email"
-        email_ids.append(email_id)
+        import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        method_responses = chain_state_mutate(api_url, token, account_id, import_call)
+        state_data, email_info, import_data = _check_chained_responses(
+            method_responses, ["Email/get", "Email/import"]
+        )
+        email_ids.append(email_info["id"])
 
-        new_state = get_email_state(api_url, token, account_id)
-        assert new_state is not None, "Failed to get new state"
+        initial_state = state_data.get("state")
+        new_state = import_data.get("newState")
+        assert initial_state is not None, "Failed to get initial state"
+        assert new_state is not None, "Email/import response missing newState"
         assert new_state != initial_state, (
             f"State did not change after import (still {initial_state[:16]}...)"
         )
@@ -107,30 +153,16 @@ class TestEmailChanges:
         """Email/changes returns newly imported email in created array (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_email_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        email_id = import_test_email(api_url, upload_url, token, account_id, mailbox_id)
-        assert email_id is not None, "Failed to import test email"
-        email_ids.append(email_id)
-
-        changes_call = [
-            "Email/changes",
-            {"accountId": account_id, "sinceState": initial_state},
-            "changes0",
-        ]
+        blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+        assert blob_id is not None, "Failed to upload test email"
 
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
+        import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        method_responses = chain_state_mutate_changes(api_url, token, account_id, import_call)
+        _, email_info, response_data = _check_chained_responses(
+            method_responses, ["Email/get", "Email/import", "Email/changes"]
         )
-        assert response_name == "Email/changes", f"Unexpected method: {response_name}"
+        email_id = email_info["id"]
+        email_ids.append(email_id)
 
         created = response_data.get("created", [])
         assert email_id in created, f"emailId {email_id} not in created: {created}"
@@ -139,13 +171,10 @@ class TestEmailChanges:
         """Email/changes maxChanges limits total IDs returned (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_email_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        for _ in range(3):
-            email_id = import_test_email(api_url, upload_url, token, account_id, mailbox_id)
-            assert email_id is not None, "Failed to import test email"
-            email_ids.append(email_id)
+        setup = setup_changes_test(api_url, upload_url, token, account_id, mailbox_id, 3)
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        email_ids.extend(email_id for email_id, _ in imported)
 
         changes_call = [
             "Email/changes",
@@ -154,16 +183,7 @@ class TestEmailChanges:
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-        )
-        assert response_name == "Email/changes", f"Unexpected method: {response_name}"
+        response_data = unpack_single_response(response, "Email/changes")
 
         created = response_data.get("created", [])
         updated = response_data.get("updated", [])
@@ -175,81 +195,70 @@ class TestEmailChanges:
         assert has_more is True, f"Expected hasMoreChanges=true, got {has_more}"
 
     def test_pagination(self, api_url, upload_url, token, account_id, mailbox_and_cleanup):
-        """Email/changes pagination returns all emails eventually (RFC 8620 Section 5.2)."""
+        """Email/changes returns all emails in one page when maxChanges covers them (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_email_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        expected_email_ids = []
-        for _ in range(3):
-            email_id = import_test_email(api_url, upload_url, token, account_id, mailbox_id)
-            assert email_id is not None, "Failed to import test email"
-            expected_email_ids.append(email_id)
+        setup = setup_changes_test(api_url, upload_url, token, account_id, mailbox_id, 3)
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        expected_email_ids = [email_id for email_id, _ in imported]
         email_ids.extend(expected_email_ids)
 
-        all_created = []
-        current_state = initial_state
-        max_iterations = 10
-
-        for iteration in range(1, max_iterations + 1):
-            changes_call = [
-                "Email/changes",
-                {"accountId": account_id, "sinceState": current_state, "maxChanges": 1},
-                f"changes{iteration}",
-            ]
+        changes_call = [
+            "Email/changes",
+            {
+                "accountId": account_id,
+                "sinceState": initial_state,
+                "maxChanges": len(expected_email_ids),
+            },
+            "changes0",
+        ]
 
-            response = make_jmap_request(api_url, token, [changes_call])
-            assert "methodResponses" in response, f"No methodResponses: {response}"
+        response = make_jmap_request(api_url, token, [changes_call])
+        response_data = unpack_single_response(response, "Email/changes")
 
-            method_responses = response["methodResponses"]
-            assert len(method_responses) > 0, "Empty methodResponses"
+        created = response_data.get("created", [])
+        missing = set(expected_email_ids) - set(created)
+        assert not missing, f"Missing emails: {missing} (found: {created})"
+        assert response_data.get("hasMoreChanges") is False, (
+            f"Expected hasMoreChanges=false, got {response_data.get('hasMoreChanges')}"
+        )
 
-            response_name, response_data, _ = method_responses[0]
-            assert response_name != "error", (
-                f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-            )
-            assert response_name == "Email/changes", f"Unexpected method: {response_name}"
+    def test_pagination_splits_when_max_changes_forces_it(
+        self, api_url, upload_url, token, account_id, mailbox_and_cleanup
+    ):
+        """Email/changes with maxChanges=1 pages through every new email (RFC 8620 Section 5.2)."""
+        mailbox_id, email_ids = mailbox_and_cleanup
 
-            created = response_data.get("created", [])
-            all_created.extend(created)
-            current_state = response_data.get("newState")
-            has_more = response_data.get("hasMoreChanges", False)
+        setup = setup_changes_test(api_url, upload_url, token, account_id, mailbox_id, 3)
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        expected_email_ids = [email_id for email_id, _ in imported]
+        email_ids.extend(expected_email_ids)
 
-            if not has_more:
-                break
+        max_pages = 10
+        max_changes = 1
+        method_responses = chain_changes_pages(
+            api_url, token, account_id, initial_state, max_pages,
+            max_changes=max_changes, type_name="Email",
+        )
+        all_created = _collect_changes_pages(method_responses, "Email", max_changes)
 
         missing = set(expected_email_ids) - set(all_created)
         assert not missing, f"Missing emails: {missing} (found: {all_created})"
 
     def test_invalid_state_returns_error(self, api_url, token, account_id):
         """Email/changes returns cannotCalculateChanges for invalid sinceState (RFC 8620 Section 5.2)."""
-        changes_call = [
-            "Email/changes",
-            {"accountId": account_id, "sinceState": "invalid-state-string"},
-            "changes0",
-        ]
-
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name == "error", f"Expected error response, got {response_name}"
-        assert response_data.get("type") == "cannotCalculateChanges", (
-            f"Expected cannotCalculateChanges, got {response_data.get('type')}"
-        )
+        _check_invalid_state_error(api_url, token, account_id, "Email")
 
 
+@pytest.mark.xdist_group(name="mailbox_changes")
 class TestMailboxChanges:
     """Tests for Mailbox/changes (RFC 8620 Section 5.2 + RFC 8621 Section 2.2)."""
 
-    def test_response_structure(self, api_url, token, account_id):
+    def test_response_structure(self, api_url, token, account_id, initial_mailbox_state):
         """Mailbox/changes response has all required fields including updatedProperties."""
-        initial_state = get_mailbox_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial Mailbox state"
+        initial_state = initial_mailbox_state
 
         changes_call = [
             "Mailbox/changes",
@@ -258,24 +267,8 @@ class TestMailboxChanges:
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-        )
-        assert response_name == "Mailbox/changes", f"Unexpected method: {response_name}"
-
-        assert response_data.get("accountId") == account_id
-        assert response_data.get("oldState") == initial_state
-        assert isinstance(response_data.get("newState"), str), "newState missing or not a string"
-        assert isinstance(response_data.get("hasMoreChanges"), bool), "hasMoreChanges missing or not a boolean"
-        assert isinstance(response_data.get("created"), list), "created missing or not an array"
-        assert isinstance(response_data.get("updated"), list), "updated missing or not an array"
-        assert isinstance(response_data.get("destroyed"), list), "destroyed missing or not an array"
+        response_data = unpack_single_response(response, "Mailbox/changes")
+        _check_changes_structure(response_data, account_id, initial_state)
 
         assert "updatedProperties" in response_data, "updatedProperties missing"
         updated_props = response_data.get("updatedProperties")
@@ -283,92 +276,54 @@ class TestMailboxChanges:
             f"updatedProperties not null or array: {type(updated_props)}"
         )
 
-    def test_state_changes_after_create(self, api_url, token, account_id):
+    def test_state_changes_after_create(self, api_url, token, account_id, scratch_mailbox_pool):
         """Mailbox state changes after creating a new mailbox (RFC 8620 Section 5.1)."""
-        initial_state = get_mailbox_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        mailbox_id = create_test_mailbox(api_url, token, account_id)
-        assert mailbox_id is not None, "Failed to create test mailbox"
+        create_call = make_mailbox_create_call(account_id, prefix="Scratch")
+        method_responses = chain_state_mutate(
+            api_url, token, account_id, create_call, type_name="Mailbox"
+        )
+        state_data, mailbox_info, set_data = _check_chained_responses(
+            method_responses, ["Mailbox/get", "Mailbox/set"], creation_id="testMailbox"
+        )
+        scratch_mailbox_pool.append(mailbox_info["id"])
 
-        new_state = get_mailbox_state(api_url, token, account_id)
-        assert new_state is not None, "Failed to get new state"
+        initial_state = state_data.get("state")
+        new_state = set_data.get("newState")
+        assert initial_state is not None, "Failed to get initial state"
+        assert new_state is not None, "Mailbox/set response missing newState"
         assert new_state != initial_state, (
             f"State did not change after create (still {initial_state[:16]}...)"
         )
 
-        destroy_mailbox(api_url, token, account_id, mailbox_id)
-
-    def test_returns_created_mailbox(self, api_url, token, account_id):
+    def test_returns_created_mailbox(self, api_url, token, account_id, scratch_mailbox_pool):
         """Mailbox/changes returns newly created mailbox in created array (RFC 8620 Section 5.2)."""
-        initial_state = get_mailbox_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        mailbox_id = create_test_mailbox(api_url, token, account_id)
-        assert mailbox_id is not None, "Failed to create test mailbox"
-
-        changes_call = [
-            "Mailbox/changes",
-            {"accountId": account_id, "sinceState": initial_state},
-            "changes0",
-        ]
-
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
+        create_call = make_mailbox_create_call(account_id, prefix="Scratch")
+        method_responses = chain_state_mutate_changes(
+            api_url, token, account_id, create_call, type_name="Mailbox"
+        )
+        _, mailbox_info, response_data = _check_chained_responses(
+            method_responses,
+            ["Mailbox/get", "Mailbox/set", "Mailbox/changes"],
+            creation_id="testMailbox",
         )
-        assert response_name == "Mailbox/changes", f"Unexpected method: {response_name}"
+        mailbox_id = mailbox_info["id"]
+        scratch_mailbox_pool.append(mailbox_id)
 
         created = response_data.get("created", [])
         assert mailbox_id in created, f"mailboxId {mailbox_id} not in created: {created}"
 
-        destroy_mailbox(api_url, token, account_id, mailbox_id)
-
     def test_invalid_state_returns_error(self, api_url, token, account_id):
         """Mailbox/changes returns cannotCalculateChanges for invalid sinceState (RFC 8620 Section 5.2)."""
-        changes_call = [
-            "Mailbox/changes",
-            {"accountId": account_id, "sinceState": "invalid-state-string"},
-            "changes0",
-        ]
-
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name == "error", f"Expected error response, got {response_name}"
-        assert response_data.get("type") == "cannotCalculateChanges", (
-            f"Expected cannotCalculateChanges, got {response_data.get('type')}"
-        )
+        _check_invalid_state_error(api_url, token, account_id, "Mailbox")
 
 
+@pytest.mark.xdist_group(name="thread_changes")
 class TestThreadChanges:
     """Tests for Thread/changes (RFC 8620 Section 5.2 + RFC 8621 Section 3.2)."""
 
-    @pytest.fixture(scope="class")
-    def mailbox_and_cleanup(self, api_url, upload_url, token, account_id):
-        """Create a test mailbox and track email IDs for cleanup."""
-        mailbox_id = create_test_mailbox(api_url, token, account_id, prefix="ThreadChangesTest")
-        assert mailbox_id is not None, "Failed to create test mailbox"
-        email_ids = []
-        yield mailbox_id, email_ids
-        if email_ids:
-            destroy_emails_and_verify_cleanup(api_url, token, account_id, email_ids)
-        destroy_mailbox(api_url, token, account_id, mailbox_id, on_destroy_remove_emails=True)
-
-    def test_response_structure(self, api_url, token, account_id):
+    def test_response_structure(self, api_url, token, account_id, initial_thread_state):
         """Thread/changes response has all required fields (RFC 8620 Section 5.2)."""
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial Thread state"
+        initial_state = initial_thread_state
 
         changes_call = [
             "Thread/changes",
@@ -377,61 +332,28 @@ class TestThreadChanges:
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-        )
-        assert response_name == "Thread/changes", f"Unexpected method: {response_name}"
-
-        assert response_data.get("accountId") == account_id, (
-            f"accountId mismatch: expected {account_id}, got {response_data.get('accountId')}"
-        )
-        assert response_data.get("oldState") == initial_state, (
-            f"oldState mismatch: expected {initial_state}, got {response_data.get('oldState')}"
-        )
-
-        new_state = response_data.get("newState")
-        assert new_state is not None, "missing newState"
-        assert isinstance(new_state, str), f"newState not a string: {type(new_state)}"
-
-        has_more = response_data.get("hasMoreChanges")
-        assert has_more is not None, "missing hasMoreChanges"
-        assert isinstance(has_more, bool), f"hasMoreChanges not a boolean: {type(has_more)}"
-
-        assert isinstance(response_data.get("created"), list), "created missing or not an array"
-        assert isinstance(response_data.get("updated"), list), "updated missing or not an array"
-        assert isinstance(response_data.get("destroyed"), list), "destroyed missing or not an array"
+        response_data = unpack_single_response(response, "Thread/changes")
+        _check_changes_structure(response_data, account_id, initial_state)
 
     def test_state_changes_after_import(self, api_url, upload_url, token, account_id, mailbox_and_cleanup):
         """Thread state changes after importing a new standalone email (RFC 8620 Section 5.1)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        unique_id = str(uuid.uuid4())[:8]
-        message_id = f"<thread-changes-test-{unique_id}@test.example>"
+        blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+        assert blob_id is not None, "Failed to upload test email"
 
-        email_id, thread_id = import_email_with_headers(
-            api_url=api_url,
-            upload_url=upload_url,
-            token=token,
-            account_id=account_id,
-            mailbox_id=mailbox_id,
-            message_id=message_id,
-            in_reply_to=None,
-            subject=f"Thread Changes Test {unique_id}",
-            received_at=datetime.now(timezone.utc),
+        import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        method_responses = chain_state_mutate_state(
+            api_url, token, account_id, import_call, type_name="Thread"
         )
-        assert email_id is not None and thread_id is not None, "Failed to import test email"
-        email_ids.append(email_id)
+        initial_data, email_info, new_data = _check_chained_responses(
+            method_responses, ["Thread/get", "Email/import", "Thread/get"]
+        )
+        email_ids.append(email_info["id"])
 
-        new_state = get_thread_state(api_url, token, account_id)
+        initial_state = initial_data.get("state")
+        new_state = new_data.get("state")
+        assert initial_state is not None, "Failed to get initial state"
         assert new_state is not None, "Failed to get new state"
         assert new_state != initial_state, (
             f"State did not change after import (still {initial_state[:16]}...)"
@@ -441,43 +363,18 @@ class TestThreadChanges:
         """Thread/changes returns newly created thread in created array (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        unique_id = str(uuid.uuid4())[:8]
-        message_id = f"<thread-changes-created-{unique_id}@test.example>"
+        blob_id, received_at_str = upload_test_email(upload_url, token, account_id)
+        assert blob_id is not None, "Failed to upload test email"
 
-        email_id, thread_id = import_email_with_headers(
-            api_url=api_url,
-            upload_url=upload_url,
-            token=token,
-            account_id=account_id,
-            mailbox_id=mailbox_id,
-            message_id=message_id,
-            in_reply_to=None,
-            subject=f"Thread Created Test {unique_id}",
-            received_at=datetime.now(timezone.utc),
+        import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        method_responses = chain_state_mutate_changes(
+            api_url, token, account_id, import_call, type_name="Thread"
         )
-        assert email_id is not None and thread_id is not None, "Failed to import test email"
-        email_ids.append(email_id)
-
-        changes_call = [
-            "Thread/changes",
-            {"accountId": account_id, "sinceState": initial_state},
-            "changes0",
-        ]
-
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
+        _, email_info, response_data = _check_chained_responses(
+            method_responses, ["Thread/get", "Email/import", "Thread/changes"]
         )
-        assert response_name == "Thread/changes", f"Unexpected method: {response_name}"
+        email_ids.append(email_info["id"])
+        thread_id = email_info["threadId"]
 
         created = response_data.get("created", [])
         assert thread_id in created, f"threadId {thread_id} not in created: {created}"
@@ -486,10 +383,7 @@ class TestThreadChanges:
         """Thread/changes returns updated thread when reply is added (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = uuid.uuid4().hex[:8]
         message_id_parent = f"<thread-changes-parent-{unique_id}@test.example>"
         base_time = datetime.now(timezone.utc) - timedelta(seconds=2)
 
@@ -507,44 +401,30 @@ class TestThreadChanges:
         assert email_id_parent is not None and thread_id is not None, "Failed to import parent email"
         email_ids.append(email_id_parent)
 
-        intermediate_state = get_thread_state(api_url, token, account_id)
-        assert intermediate_state is not None, "Failed to get intermediate state"
-
-        email_id_reply, thread_id_reply = import_email_with_headers(
-            api_url=api_url,
+        blob_id, received_at_str = upload_email_with_headers(
             upload_url=upload_url,
             token=token,
             account_id=account_id,
-            mailbox_id=mailbox_id,
             message_id=f"<thread-changes-reply-{unique_id}@test.example>",
             in_reply_to=message_id_parent,
             subject=f"Re: Thread Updated Parent {unique_id}",
             received_at=base_time + timedelta(seconds=1),
         )
-        assert email_id_reply is not None and thread_id_reply is not None, "Failed to import reply email"
-        email_ids.append(email_id_reply)
+        assert blob_id is not None, "Failed to upload reply email"
 
-        assert thread_id == thread_id_reply, (
-            f"Reply did not join parent thread: parent={thread_id}, reply={thread_id_reply}"
+        import_call = make_import_call(account_id, mailbox_id, blob_id, received_at_str)
+        method_responses = chain_state_mutate_changes(
+            api_url, token, account_id, import_call, type_name="Thread"
         )
+        _, email_info, response_data = _check_chained_responses(
+            method_responses, ["Thread/get", "Email/import", "Thread/changes"]
+        )
+        email_ids.append(email_info["id"])
+        thread_id_reply = email_info["threadId"]
 
-        changes_call = [
-            "Thread/changes",
-            {"accountId": account_id, "sinceState": intermediate_state},
-            "changes0",
-        ]
-
-        response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
+        assert thread_id == thread_id_reply, (
+            f"Reply did not join parent thread: parent={thread_id}, reply={thread_id_reply}"
         )
-        assert response_name == "Thread/changes", f"Unexpected method: {response_name}"
 
         updated = response_data.get("updated", [])
         assert thread_id in updated, f"threadId {thread_id} not in updated: {updated}"
@@ -553,26 +433,12 @@ class TestThreadChanges:
         """Thread/changes maxChanges limits total IDs returned (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        for i in range(3):
-            unique_id = str(uuid.uuid4())[:8]
-            message_id = f"<thread-changes-max-{i}-{unique_id}@test.example>"
-
-            email_id, thread_id = import_email_with_headers(
-                api_url=api_url,
-                upload_url=upload_url,
-                token=token,
-                account_id=account_id,
-                mailbox_id=mailbox_id,
-                message_id=message_id,
-                in_reply_to=None,
-                subject=f"Thread Max Changes Test {i} {unique_id}",
-                received_at=datetime.now(timezone.utc),
-            )
-            assert email_id is not None and thread_id is not None, f"Failed to import test email {i}"
-            email_ids.append(email_id)
+        setup = setup_changes_test(
+            api_url, upload_url, token, account_id, mailbox_id, 3, type_name="Thread"
+        )
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        email_ids.extend(email_id for email_id, _ in imported)
 
         changes_call = [
             "Thread/changes",
@@ -581,16 +447,7 @@ class TestThreadChanges:
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
-
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
-
-        response_name, response_data, _ = method_responses[0]
-        assert response_name != "error", (
-            f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-        )
-        assert response_name == "Thread/changes", f"Unexpected method: {response_name}"
+        response_data = unpack_single_response(response, "Thread/changes")
 
         created = response_data.get("created", [])
         updated = response_data.get("updated", [])
@@ -602,82 +459,62 @@ class TestThreadChanges:
         assert has_more is True, f"Expected hasMoreChanges=true, got {has_more}"
 
     def test_pagination(self, api_url, upload_url, token, account_id, mailbox_and_cleanup):
-        """Thread/changes pagination returns all threads eventually (RFC 8620 Section 5.2)."""
+        """Thread/changes returns all threads in one page when maxChanges covers them (RFC 8620 Section 5.2)."""
         mailbox_id, email_ids = mailbox_and_cleanup
 
-        initial_state = get_thread_state(api_url, token, account_id)
-        assert initial_state is not None, "Failed to get initial state"
-
-        expected_thread_ids = []
-        for i in range(3):
-            unique_id = str(uuid.uuid4())[:8]
-            message_id = f"<thread-changes-page-{i}-{unique_id}@test.example>"
-
-            email_id, thread_id = import_email_with_headers(
-                api_url=api_url,
-                upload_url=upload_url,
-                token=token,
-                account_id=account_id,
-                mailbox_id=mailbox_id,
-                message_id=message_id,
-                in_reply_to=None,
-                subject=f"Thread Pagination Test {i} {unique_id}",
-                received_at=datetime.now(timezone.utc),
-            )
-            assert email_id is not None and thread_id is not None, f"Failed to import test email {i}"
-            email_ids.append(email_id)
-            expected_thread_ids.append(thread_id)
-
-        all_created = []
-        current_state = initial_state
-        max_iterations = 10
-
-        for iteration in range(1, max_iterations + 1):
-            changes_call = [
-                "Thread/changes",
-                {"accountId": account_id, "sinceState": current_state, "maxChanges": 1},
-                f"changes{iteration}",
-            ]
-
-            response = make_jmap_request(api_url, token, [changes_call])
-            assert "methodResponses" in response, f"No methodResponses: {response}"
-
-            method_responses = response["methodResponses"]
-            assert len(method_responses) > 0, "Empty methodResponses"
-
-            response_name, response_data, _ = method_responses[0]
-            assert response_name != "error", (
-                f"JMAP error: {response_data.get('type')}: {response_data.get('description')}"
-            )
-            assert response_name == "Thread/changes", f"Unexpected method: {response_name}"
-
-            created = response_data.get("created", [])
-            all_created.extend(created)
-            current_state = response_data.get("newState")
-            has_more = response_data.get("hasMoreChanges", False)
-
-            if not has_more:
-                break
-
-        missing = set(expected_thread_ids) - set(all_created)
-        assert not missing, f"Missing threads: {missing} (found: {all_created})"
+        setup = setup_changes_test(
+            api_url, upload_url, token, account_id, mailbox_id, 3, type_name="Thread"
+        )
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        email_ids.extend(email_id for email_id, _ in imported)
+        expected_thread_ids = [thread_id for _, thread_id in imported]
 
-    def test_invalid_state_returns_error(self, api_url, token, account_id):
-        """Thread/changes returns cannotCalculateChanges for invalid sinceState (RFC 8620 Section 5.2)."""
         changes_call = [
             "Thread/changes",
-            {"accountId": account_id, "sinceState": "invalid-state-string"},
+            {
+                "accountId": account_id,
+                "sinceState": initial_state,
+                "maxChanges": len(expected_thread_ids),
+            },
             "changes0",
         ]
 
         response = make_jmap_request(api_url, token, [changes_call])
-        assert "methodResponses" in response, f"No methodResponses: {response}"
+        response_data = unpack_single_response(response, "Thread/changes")
 
-        method_responses = response["methodResponses"]
-        assert len(method_responses) > 0, "Empty methodResponses"
+        created = response_data.get("created", [])
+        missing = set(expected_thread_ids) - set(created)
+        assert not missing, f"Missing threads: {missing} (found: {created})"
+        assert response_data.get("hasMoreChanges") is False, (
+            f"Expected hasMoreChanges=false, got {response_data.get('hasMoreChanges')}"
+        )
+
+    def test_pagination_splits_when_max_changes_forces_it(
+        self, api_url, upload_url, token, account_id, mailbox_and_cleanup
+    ):
+        """Thread/changes with maxChanges=1 pages through every new thread (RFC 8620 Section 5.2)."""
+        mailbox_id, email_ids = mailbox_and_cleanup
 
-        response_name, response_data, _ = method_responses[0]
-        assert response_name == "error", f"Expected error response, got {response_name}"
-        assert response_data.get("type") == "cannotCalculateChanges", (
-            f"Expected cannotCalculateChanges, got {response_data.get('type')}"
+        setup = setup_changes_test(
+            api_url, upload_url, token, account_id, mailbox_id, 3, type_name="Thread"
         )
+        assert setup is not None, "Failed to get initial state and import test emails"
+        initial_state, imported = setup
+        email_ids.extend(email_id for email_id, _ in imported)
+        expected_thread_ids = [thread_id for _, thread_id in imported]
+
+        max_pages = 10
+        max_changes = 1
+        method_responses = chain_changes_pages(
+            api_url, token, account_id, initial_state, max_pages,
+            max_changes=max_changes, type_name="Thread",
+        )
+        all_created = _collect_changes_pages(method_responses, "Thread", max_changes)
+
+        missing = set(expected_thread_ids) - set(all_created)
+        assert not missing, f"Missing threads: {missing} (found: {all_created})"
+
+    def test_invalid_state_returns_error(self, api_url, token, account_id):
+        """Thread/changes returns cannotCalculateChanges for invalid sinceState (RFC 8620 Section 5.2)."""
+        _check_invalid_state_error(api_url, token, account_id, "Thread")
@@ -21,6 +21,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 class TestEmailImportAndGet:
     """Full lifecycle test: Mailbox/set -> Mailbox/get -> Email/import -> Email/get."""
 
@@ -19,6 +19,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 def email_get_with_properties(
     api_url: str, token: str, account_id: str, email_id: str, properties: list[str]
 ) -> dict | None:
@@ -21,6 +21,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 class TestEmailQueryTotal:
     """Tests for the Email/query total field behavior."""
 
@@ -5,10 +5,13 @@ Tests for Email/set method focusing on mailboxIds changes, mailbox counter updat
 and state tracking per RFC 8620/8621.
 """
 
+import pytest
+
 from helpers import (
     make_jmap_request,
     create_test_mailbox,
     import_test_email,
+    import_and_fetch,
     get_email_state,
     get_mailbox_state,
     get_mailbox_counts,
@@ -20,6 +23,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 # =============================================================================
 # Test: mailboxIds Changes (RFC 8621 Section 4.6)
 # =============================================================================
@@ -946,17 +952,19 @@ class TestKeywordUpdates:
             mailbox_id = create_test_mailbox(api_url, token, account_id)
             assert mailbox_id, "Failed to create mailbox"
 
-            # Import email with some keywords
-            email_id = import_test_email(
+            # Import email with some keywords and read them back in one request
+            email_id, _, fetched = import_and_fetch(
                 api_url, upload_url, token, account_id, mailbox_id,
+                properties=["keywords"],
                 keywords={"$seen": True, "$answered": True},
             )
             assert email_id, "Failed to import email"
             email_ids.append(email_id)
 
             # Verify initial keywords
-            initial_keywords = get_email_keywords(api_url, token, account_id, email_id)
-            assert initial_keywords is not None, "Failed to get initial keywords"
+            assert fetched is not None, "Email/get in import_and_fetch returned no email"
+            initial_keywords = fetched.get("keywords")
+            assert initial_keywords is not None, f"Fetched email has no keywords: {fetched}"
             assert initial_keywords.get("$seen") and initial_keywords.get("$answered"), (
                 f"Expected $seen and $answered, got: {initial_keywords}"
             )
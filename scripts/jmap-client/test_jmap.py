@@ -16,6 +16,9 @@ from jmapc.methods import CoreEcho, EmailQuery
 from helpers import make_jmap_request
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 # ---------------------------------------------------------------------------
 # Module-level helpers
 # ---------------------------------------------------------------------------
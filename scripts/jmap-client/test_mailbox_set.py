@@ -18,6 +18,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 class TestMailboxSetDestroy:
     """Tests for Mailbox/set destroy (RFC 8621 Section 2.5)."""
 
@@ -16,6 +16,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 class TestResultReferences:
     """Tests for JMAP result references (RFC 8620 Section 3.7)."""
 
@@ -21,6 +21,9 @@ from helpers import (
 )
 
 
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
+
 class TestThread:
     """Tests for Thread/get (RFC 8621 Section 3)."""
 